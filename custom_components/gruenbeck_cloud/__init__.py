@@ -4,12 +4,15 @@ from __future__ import annotations
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 
-from .const import DOMAIN
+from .account import async_get_account, async_release_account
+from .const import CONF_DEVICE_ID, DOMAIN
 from .coordinator import GruenbeckCloudCoordinator
 from .services import register_services
+from .storage import GruenbeckCloudStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,10 +30,31 @@ PLATFORMS: list[Platform] = [
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Grünbeck Cloud from a config entry."""
+    store = GruenbeckCloudStore(hass, entry.entry_id)
+    await store.async_load()
+
+    account = async_get_account(
+        hass, entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD]
+    )
+    # Avoid a full login at startup if a token from the last run is available
+    account.restore_auth_token(store.auth_token)
+
     coordinator: GruenbeckCloudCoordinator = GruenbeckCloudCoordinator(
-        hass, config_entry=entry
+        hass, config_entry=entry, account=account, store=store
     )
-    await coordinator.async_config_entry_first_refresh()
+    if (device := store.device) is not None and device.id == entry.data[CONF_DEVICE_ID]:
+        # Entities come up with the last known data, refresh in background
+        coordinator.async_restore_data(device)
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_{entry.entry_id}_refresh"
+        )
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            await coordinator.disconnect()
+            await async_release_account(hass, account)
+            raise
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
@@ -55,12 +79,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             await coordinator.disconnect()
             if coordinator.unsub:
                 coordinator.unsub()
+            await async_release_account(hass, coordinator.account)
 
         del hass.data[DOMAIN][entry.entry_id]
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove locally stored data of a config entry."""
+    await GruenbeckCloudStore(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload the config entry when it changed."""
     await hass.config_entries.async_reload(entry.entry_id)
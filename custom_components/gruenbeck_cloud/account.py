@@ -0,0 +1,311 @@
+"""Account handling for Grünbeck Cloud integration."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import heapq
+import itertools
+import logging
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import ClientSession, CookieJar, TraceConfig
+from pygruenbeck_cloud import PyGruenbeckCloud
+from pygruenbeck_cloud.exceptions import (
+    PyGruenbeckCloudConnectionError,
+    PyGruenbeckCloudError,
+    PyGruenbeckCloudResponseError,
+    PyGruenbeckCloudResponseStatusError,
+)
+from pygruenbeck_cloud.models import GruenbeckAuthToken
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+from .const import (
+    DATA_ACCOUNTS,
+    DOMAIN,
+    PRIORITY_NAMES,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_PER_SECOND,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GruenbeckCloudRateLimiter:
+    """Token bucket limiting the API requests of an account.
+
+    Requests waiting for a token are served by priority, lower values first,
+    and in order of arrival within the same priority.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize rate limiter."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._lanes: dict[str, dict[str, Any]] = {
+            name: {
+                "requests": 0,
+                "delayed_requests": 0,
+                "wait_time_total": 0.0,
+                "wait_time_max": 0.0,
+            }
+            for name in PRIORITY_NAMES.values()
+        }
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Return the requests and waiting times of each priority lane."""
+        queue_depth = dict.fromkeys(PRIORITY_NAMES.values(), 0)
+        for priority, _, future in self._waiters:
+            if not future.done():
+                queue_depth[PRIORITY_NAMES[priority]] += 1
+
+        return {
+            name: {
+                **lane,
+                "queue_depth": queue_depth[name],
+                "wait_time_total": round(lane["wait_time_total"], 3),
+                "wait_time_max": round(lane["wait_time_max"], 3),
+            }
+            for name, lane in self._lanes.items()
+        }
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    async def async_acquire(self, priority: int) -> None:
+        """Wait until a request of the given priority may be sent."""
+        lane = self._lanes[PRIORITY_NAMES[priority]]
+        lane["requests"] += 1
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._schedule()
+
+        start = time.monotonic()
+        try:
+            await future
+        finally:
+            waited = time.monotonic() - start
+            lane["delayed_requests"] += 1
+            lane["wait_time_total"] += waited
+            lane["wait_time_max"] = max(lane["wait_time_max"], waited)
+
+    def _schedule(self) -> None:
+        """Wake up waiters once the next token is available."""
+        if self._timer is not None or not self._waiters:
+            return
+
+        delay = max(0.0, (1 - self._tokens) / self._rate)
+        self._timer = asyncio.get_running_loop().call_later(delay, self._release)
+
+    def _release(self) -> None:
+        """Hand out available tokens to the waiters with highest priority."""
+        self._timer = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            # Cancelled waiters do not consume a token
+            if future.done():
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+
+        self._schedule()
+
+
+class GruenbeckCloudAccount:
+    """Login and HTTP session shared by all devices of one account."""
+
+    def __init__(self, hass: HomeAssistant, username: str, password: str) -> None:
+        """Initialize account."""
+        self.username = username
+        self._password = password
+        self.references = 0
+        self.logins = 0
+        self.token_restored = False
+
+        # Connections of the pool, counted by tracing the session requests
+        self._pool_counters = {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+        }
+        trace_config = TraceConfig()
+        trace_config.on_request_start.append(self._trace_counter("requests"))
+        trace_config.on_connection_create_end.append(
+            self._trace_counter("connections_created")
+        )
+        trace_config.on_connection_reuseconn.append(
+            self._trace_counter("connections_reused")
+        )
+
+        # Own session for the login cookies, using the keep-alive connection
+        # pool of Home Assistant. Same cookie handling as the API client uses
+        # for its own session.
+        self.session: ClientSession = async_create_clientsession(
+            hass,
+            auto_cleanup=False,
+            cookie_jar=CookieJar(quote_cookie=False),
+            trace_configs=[trace_config],
+        )
+
+        # Client only used to log in and refresh the shared token
+        self._api = PyGruenbeckCloud(username=username, password=password)
+        self._api.logger = _LOGGER
+        self._api.session = self.session
+        self._lock = asyncio.Lock()
+
+        # Requests of all devices count against the same cloud limits
+        self.rate_limiter = GruenbeckCloudRateLimiter(
+            RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST
+        )
+
+    def _trace_counter(self, key: str) -> Any:
+        """Return a trace callback counting the event in the pool statistics."""
+
+        async def count(
+            _session: ClientSession, _context: SimpleNamespace, _params: Any
+        ) -> None:
+            """Count a traced event."""
+            self._pool_counters[key] += 1
+
+        return count
+
+    @property
+    def pool_statistics(self) -> dict[str, Any]:
+        """Return statistics of the connection pool used by the account."""
+        counters = self._pool_counters
+        connections = counters["connections_created"] + counters["connections_reused"]
+        connector = self.session.connector
+        return {
+            **counters,
+            "reuse_ratio": (
+                round(counters["connections_reused"] / connections, 3)
+                if connections
+                else None
+            ),
+            "limit": connector.limit if connector else None,
+            "limit_per_host": connector.limit_per_host if connector else None,
+        }
+
+    @property
+    def auth_token(self) -> GruenbeckAuthToken | None:
+        """Return the shared auth token."""
+        return self._api._auth_token  # pylint: disable=protected-access
+
+    def create_api(self) -> PyGruenbeckCloud:
+        """Return a new API client for a device of this account."""
+        api = PyGruenbeckCloud(username=self.username, password=self._password)
+        api.session = self.session
+        return api
+
+    @callback
+    def restore_auth_token(self, token: GruenbeckAuthToken | None) -> None:
+        """Use a token stored locally, unless the account is logged in already."""
+        if token is None or self.auth_token is not None:
+            return
+
+        self._api._auth_token = token  # pylint: disable=protected-access
+        self.token_restored = True
+
+    @callback
+    def discard_restored_auth_token(self) -> bool:
+        """Drop a restored token which was rejected by the API."""
+        if not self.token_restored:
+            return False
+
+        _LOGGER.info("Stored token of %s was rejected, logging in again", self.username)
+        self._api._auth_token = None  # pylint: disable=protected-access
+        self.token_restored = False
+        return True
+
+    async def async_authenticate(
+        self, api: PyGruenbeckCloud, renew_before: timedelta | None = None
+    ) -> None:
+        """Make sure the given API client uses a valid shared token.
+
+        With renew_before, a token expiring within that time is renewed too.
+        """
+        async with self._lock:
+            # pylint: disable=protected-access
+            if self.auth_token is not None and (
+                self.auth_token.is_expired()
+                or (
+                    renew_before is not None
+                    and datetime.now() >= self.auth_token.expires_on - renew_before
+                )
+            ):
+                # Refreshes the token in place for every client using it
+                try:
+                    await self._api._refresh_web_token()
+                except (
+                    PyGruenbeckCloudError,
+                    PyGruenbeckCloudConnectionError,
+                    PyGruenbeckCloudResponseError,
+                    PyGruenbeckCloudResponseStatusError,
+                ) as err:
+                    _LOGGER.debug("Unable to refresh token, logging in again: %s", err)
+                    self._api._auth_token = None
+
+            if self.auth_token is None:
+                _LOGGER.debug("Logging in to Grünbeck Cloud as %s", self.username)
+                self.logins += 1
+                self.token_restored = False
+                if not await self._api.login():
+                    msg = "Unable to login to Grünbeck Cloud"
+                    raise HomeAssistantError(msg)
+
+            api._auth_token = self.auth_token
+
+    @callback
+    def async_close(self) -> None:
+        """Release the shared session, the pool of Home Assistant is kept."""
+        # The connector belongs to Home Assistant, closing the session would
+        # only log a warning
+        self.session.detach()
+
+
+@callback
+def async_get_account(
+    hass: HomeAssistant, username: str, password: str
+) -> GruenbeckCloudAccount:
+    """Return the shared account for the username, creating it if needed."""
+    accounts: dict[str, GruenbeckCloudAccount] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DATA_ACCOUNTS, {})
+    if (account := accounts.get(username)) is None:
+        account = accounts[username] = GruenbeckCloudAccount(hass, username, password)
+
+    account.references += 1
+    return account
+
+
+async def async_release_account(
+    hass: HomeAssistant, account: GruenbeckCloudAccount
+) -> None:
+    """Release the account, the last user releases its session."""
+    account.references -= 1
+    if account.references > 0:
+        return
+
+    hass.data[DOMAIN][DATA_ACCOUNTS].pop(account.username, None)
+    account.async_close()
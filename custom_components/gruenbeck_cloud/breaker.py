@@ -0,0 +1,149 @@
+"""Circuit breaker for Grünbeck Cloud API endpoints."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+import time
+from typing import Any
+
+from aiohttp import ClientError
+from pygruenbeck_cloud.exceptions import (
+    PyGruenbeckCloudConnectionError,
+    PyGruenbeckCloudError,
+    PyGruenbeckCloudResponseError,
+    PyGruenbeckCloudResponseStatusError,
+)
+
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Errors of an unhealthy endpoint, rejected parameter values do not count
+ENDPOINT_ERRORS: tuple[type[Exception], ...] = (
+    ClientError,
+    PyGruenbeckCloudConnectionError,
+    PyGruenbeckCloudResponseError,
+    PyGruenbeckCloudResponseStatusError,
+    asyncio.TimeoutError,
+)
+# Errors of a request which did not return, including rejected ones
+REQUEST_ERRORS: tuple[type[Exception], ...] = (
+    HomeAssistantError,
+    PyGruenbeckCloudError,
+    *ENDPOINT_ERRORS,
+)
+
+
+class GruenbeckCloudCircuitOpenError(HomeAssistantError):
+    """Error raised for requests to an endpoint with an open circuit."""
+
+
+class GruenbeckCloudCircuitBreaker:
+    """Stop calling an API endpoint after repeated failures.
+
+    After the failure threshold the circuit opens and requests fail fast.
+    Once the reset timeout passed, it is half-open and a single trial request
+    is let through, closing the circuit on success or opening it again with
+    a doubled timeout on failure.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        failure_threshold: int,
+        reset_timeout: timedelta,
+        max_reset_timeout: timedelta,
+    ) -> None:
+        """Initialize circuit breaker."""
+        self.endpoint = endpoint
+        self._failure_threshold = failure_threshold
+        self._base_reset_timeout = reset_timeout
+        self._max_reset_timeout = max_reset_timeout
+        self.reset_timeout = reset_timeout
+        self._opened: float | None = None
+        self._trial = False
+
+        self.failures = 0
+        self.rejected_requests = 0
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        """Return the state of the circuit."""
+        if self._opened is None:
+            return CIRCUIT_CLOSED
+        if time.monotonic() - self._opened < self.reset_timeout.total_seconds():
+            return CIRCUIT_OPEN
+        return CIRCUIT_HALF_OPEN
+
+    @property
+    def retry_in(self) -> timedelta:
+        """Return the time until the next trial request is allowed."""
+        if self._opened is None:
+            return timedelta(0)
+        return max(
+            self.reset_timeout - timedelta(seconds=time.monotonic() - self._opened),
+            timedelta(0),
+        )
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Return statistics of the circuit breaker."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "trips": self.trips,
+            "rejected_requests": self.rejected_requests,
+            "reset_timeout": self.reset_timeout.total_seconds(),
+        }
+
+    def before_request(self) -> None:
+        """Raise if the endpoint must not be called now."""
+        state = self.state
+        if state == CIRCUIT_CLOSED:
+            return
+        if state == CIRCUIT_HALF_OPEN and not self._trial:
+            self._trial = True
+            return
+
+        self.rejected_requests += 1
+        msg = (
+            f"Circuit of {self.endpoint} endpoint is open, "
+            f"retrying in {round(self.retry_in.total_seconds())}s"
+        )
+        raise GruenbeckCloudCircuitOpenError(msg)
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        if self._opened is not None:
+            _LOGGER.info("Circuit of %s endpoint closed", self.endpoint)
+        self.failures = 0
+        self.reset_timeout = self._base_reset_timeout
+        self._opened = None
+        self._trial = False
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit if needed."""
+        self.failures += 1
+        if self._trial:
+            # Trial request failed, wait longer before the next one
+            self.reset_timeout = min(self.reset_timeout * 2, self._max_reset_timeout)
+        elif self._opened is not None or self.failures < self._failure_threshold:
+            return
+
+        _LOGGER.warning(
+            "Circuit of %s endpoint opened for %s after %d failures",
+            self.endpoint,
+            self.reset_timeout,
+            self.failures,
+        )
+        self.trips += 1
+        self._opened = time.monotonic()
+        self._trial = False
+
+    def release_trial(self) -> None:
+        """Allow another trial if one ended without a result, e.g. cancelled."""
+        self._trial = False
@@ -4,21 +4,42 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from aiohttp import CookieJar
 from pygruenbeck_cloud import PyGruenbeckCloud
 from pygruenbeck_cloud.models import Device
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigFlowResult
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
+    CONF_USERNAME,
+)
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.helpers.selector import (
     SelectOptionDict,
     SelectSelectorMode,
     selector,
 )
 
-from .const import CONF_DEVICE_ID, DOMAIN
+from .const import (
+    CONF_DEVICE_ID,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_PARAMETER_SCAN_INTERVAL,
+    CONF_UPDATE_COALESCE_WINDOW,
+    DOMAIN,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+    PARAMETER_UPDATE_INTERVAL,
+    UPDATE_COALESCE_WINDOW,
+    UPDATE_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,6 +58,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     config_data: dict[str, Any] = {}
     devices: list[Device] = []
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -114,11 +143,16 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def get_devices(self, data: dict[str, Any]) -> list[Device]:
         """Validate the user input if we are able to connect."""
+        # Temporary session for the login cookies, using the pool of Home Assistant
+        session = async_create_clientsession(
+            self.hass, auto_cleanup=False, cookie_jar=CookieJar(quote_cookie=False)
+        )
         try:
             api = PyGruenbeckCloud(
                 username=data[CONF_USERNAME],
                 password=data[CONF_PASSWORD],
             )
+            api.session = session
 
             # Test Login credentials
             if not await api.login():
@@ -140,11 +174,80 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         except ConnectionRefusedError as err:
             _LOGGER.warning(err)
             raise CannotConnect from err
+        finally:
+            # Only the session is released, the connector is the pool of
+            # Home Assistant
+            session.detach()
 
         # Return info that you want to store in the config entry.
         return devices
 
 
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Grünbeck Cloud options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if user_input[CONF_MIN_SCAN_INTERVAL] > user_input[CONF_MAX_SCAN_INTERVAL]:
+                errors["base"] = "invalid_scan_interval_bounds"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = user_input or self._entry.options
+        min_interval = int(MIN_UPDATE_INTERVAL.total_seconds())
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_SCAN_INTERVAL,
+                    default=options.get(
+                        CONF_SCAN_INTERVAL, int(UPDATE_INTERVAL.total_seconds())
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=min_interval)),
+                vol.Required(
+                    CONF_MIN_SCAN_INTERVAL,
+                    default=options.get(
+                        CONF_MIN_SCAN_INTERVAL, int(MIN_SCAN_INTERVAL.total_seconds())
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=min_interval)),
+                vol.Required(
+                    CONF_MAX_SCAN_INTERVAL,
+                    default=options.get(
+                        CONF_MAX_SCAN_INTERVAL, int(MAX_SCAN_INTERVAL.total_seconds())
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=min_interval)),
+                vol.Required(
+                    CONF_PARAMETER_SCAN_INTERVAL,
+                    default=options.get(
+                        CONF_PARAMETER_SCAN_INTERVAL,
+                        int(PARAMETER_UPDATE_INTERVAL.total_seconds()),
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=min_interval)),
+                vol.Required(
+                    CONF_UPDATE_COALESCE_WINDOW,
+                    default=options.get(
+                        CONF_UPDATE_COALESCE_WINDOW,
+                        UPDATE_COALESCE_WINDOW.total_seconds(),
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+                vol.Optional(
+                    CONF_HOST, description={"suggested_value": options.get(CONF_HOST)}
+                ): str,
+            }
+        )
+
+        return self.async_show_form(
+            step_id="init", data_schema=data_schema, errors=errors
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
@@ -1,19 +1,107 @@
 """Constants for the Grünbeck Cloud integration."""
+from dataclasses import fields
 from datetime import timedelta
 from typing import Final
 
+from pygruenbeck_cloud.models import DeviceParameters
 import voluptuous as vol
 
+from homeassistant.helpers import config_validation as cv
+
 DOMAIN: Final = "gruenbeck_cloud"
 NAME: Final = "Grünbeck Cloud"
 COORDINATOR: Final = "coordinator"
+# Key in hass.data[DOMAIN] holding the shared account sessions
+DATA_ACCOUNTS: Final = "accounts"
 MANUFACTURER: Final = "Grünbeck Wasseraufbereitung GmbH"
 
 # Configuration parameter
 CONF_DEVICE_ID: Final = "device_id"
 
+# Options
+CONF_PARAMETER_SCAN_INTERVAL: Final = "parameter_scan_interval"
+CONF_UPDATE_COALESCE_WINDOW: Final = "update_coalesce_window"
+CONF_MIN_SCAN_INTERVAL: Final = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL: Final = "max_scan_interval"
+
 # Polling update interval
 UPDATE_INTERVAL: Final = timedelta(seconds=360)
+# Parameters only change when they are written, so they are polled less often
+PARAMETER_UPDATE_INTERVAL: Final = timedelta(hours=1)
+MIN_UPDATE_INTERVAL: Final = timedelta(seconds=30)
+# Polling update interval while WebSocket does not push data
+FALLBACK_UPDATE_INTERVAL: Final = timedelta(seconds=120)
+# Default bounds of the adaptive polling interval, the lower one is used while
+# regenerating without WebSocket, the upper one while idle with WebSocket.
+MIN_SCAN_INTERVAL: Final = timedelta(seconds=60)
+MAX_SCAN_INTERVAL: Final = timedelta(minutes=15)
+# Polling update interval of realtime values in the local network
+LOCAL_UPDATE_INTERVAL: Final = timedelta(seconds=10)
+LOCAL_REQUEST_TIMEOUT: Final = timedelta(seconds=5)
+
+# Entities are updated at most once per window for bursts of WebSocket frames
+UPDATE_COALESCE_WINDOW: Final = timedelta(seconds=1)
+
+# Parameter writes within this window are sent as one API request
+PARAMETER_WRITE_WINDOW: Final = timedelta(milliseconds=300)
+
+# WebSocket reconnect backoff, the first reconnect is tried immediately
+WEBSOCKET_RECONNECT_DELAY: Final = timedelta(seconds=5)
+WEBSOCKET_RECONNECT_MAX_DELAY: Final = timedelta(minutes=5)
+WEBSOCKET_RECONNECT_MAX_ATTEMPTS: Final = 10
+
+# WebSocket is considered dead if no frame (including pings) arrives in time,
+# during a regeneration the device pushes data more often.
+WEBSOCKET_WATCHDOG_INTERVAL: Final = timedelta(seconds=30)
+WEBSOCKET_STALE_TIMEOUT: Final = timedelta(minutes=3)
+WEBSOCKET_STALE_TIMEOUT_REGENERATION: Final = timedelta(seconds=60)
+# The data stream of the device lapses without a keepalive, it is sent at the
+# default poll interval however rarely the device is polled.
+WEBSOCKET_KEEPALIVE_INTERVAL: Final = UPDATE_INTERVAL
+
+# Device attributes grouping fields, used to detect which fields changed
+DEVICE_SECTIONS: Final = ("realtime", "parameters")
+
+# Auth token is renewed in background ahead of the library's lazy refresh
+TOKEN_REFRESH_BEFORE_EXPIRY: Final = timedelta(minutes=15)
+TOKEN_REFRESH_RETRY: Final = timedelta(minutes=1)
+
+# Requests per second and burst size allowed for all devices of an account
+RATE_LIMIT_PER_SECOND: Final = 1.0
+RATE_LIMIT_BURST: Final = 5
+
+# Priority lanes of API requests, writes and services are sent before the
+# background refresh
+PRIORITY_USER: Final = 0
+PRIORITY_BACKGROUND: Final = 1
+PRIORITY_NAMES: Final = {PRIORITY_USER: "user", PRIORITY_BACKGROUND: "background"}
+
+# Timeout of a single request per API endpoint, the whole refresh has to finish
+# within its own deadline.
+REQUEST_TIMEOUT: Final = timedelta(seconds=15)
+REQUEST_TIMEOUTS: Final = {
+    "sd": timedelta(seconds=10),
+    "measurements": timedelta(seconds=30),
+}
+REFRESH_TIMEOUT: Final = timedelta(seconds=30)
+
+# Circuit breaker of each API endpoint, the open time doubles for each failed
+# trial request until the endpoint answers again.
+CIRCUIT_BREAKER_FAILURE_THRESHOLD: Final = 3
+CIRCUIT_BREAKER_RESET_TIMEOUT: Final = timedelta(minutes=1)
+CIRCUIT_BREAKER_MAX_RESET_TIMEOUT: Final = timedelta(minutes=30)
+CIRCUIT_CLOSED: Final = "closed"
+CIRCUIT_HALF_OPEN: Final = "half_open"
+CIRCUIT_OPEN: Final = "open"
+# Breaker states ordered by severity
+CIRCUIT_STATES: Final = (CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN)
+
+# Local storage of tokens and device data
+STORAGE_VERSION: Final = 1
+STORAGE_SAVE_DELAY: Final = 10
+# Realtime values change with most polls, device snapshots are written less
+# often to spare the flash storage of the host
+STORAGE_DEVICE_SAVE_DELAY: Final = 300
 
 # Custom Unit of Measurement
 UNIT_OF_DH: Final = "°dH"
@@ -26,12 +114,33 @@ UNIT_OF_L_HOUR: Final = "l/h"
 SERVICE_UPDATE_DEVICE_PARAMETERS: Final = "change_settings"
 SERVICE_PARAM_PARAMETER: Final = "parameter"
 SERVICE_PARAM_VALUE: Final = "value"
-SERVICE_UPDATE_DEVICE_PARAMETERS_SCHEMA = vol.Schema(
-    {
-        vol.Required(SERVICE_PARAM_PARAMETER): str,
-        vol.Required(SERVICE_PARAM_VALUE): vol.Any(str, int),
-    }
+SERVICE_PARAM_PARAMETERS: Final = "parameters"
+# Names of the parameters which can be changed on the device
+DEVICE_PARAMETERS: Final = tuple(field.name for field in fields(DeviceParameters))
+SERVICE_UPDATE_DEVICE_PARAMETERS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Inclusive(SERVICE_PARAM_PARAMETER, "parameter"): vol.In(
+                DEVICE_PARAMETERS
+            ),
+            vol.Inclusive(SERVICE_PARAM_VALUE, "parameter"): vol.Any(str, int),
+            vol.Optional(SERVICE_PARAM_PARAMETERS): {
+                vol.In(DEVICE_PARAMETERS): vol.Any(str, int, float, bool)
+            },
+        }
+    ),
+    cv.has_at_least_one_key(SERVICE_PARAM_PARAMETER, SERVICE_PARAM_PARAMETERS),
 )
 SERVICE_GET_SALT_MEASUREMENTS: Final = "get_device_salt_measurements"
 SERVICE_GET_WATER_MEASUREMENTS: Final = "get_device_water_measurements"
+SERVICE_PARAM_FORCE_REFRESH: Final = "force_refresh"
+SERVICE_PARAM_START_DATE: Final = "start_date"
+SERVICE_PARAM_END_DATE: Final = "end_date"
+SERVICE_GET_MEASUREMENTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(SERVICE_PARAM_FORCE_REFRESH, default=False): cv.boolean,
+        vol.Optional(SERVICE_PARAM_START_DATE): cv.date,
+        vol.Optional(SERVICE_PARAM_END_DATE): cv.date,
+    }
+)
 SERVICE_REGENERATE: Final = "regenerate"
@@ -1,21 +1,28 @@
 """Coordinator for Grünbeck Cloud integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+from contextlib import suppress
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
 import logging
-from typing import Any
+import random
+import time
+from typing import Any, TypeVar, cast
 
-from pygruenbeck_cloud import PyGruenbeckCloud
 from pygruenbeck_cloud.exceptions import (
     PyGruenbeckCloudConnectionClosedError,
     PyGruenbeckCloudConnectionError,
     PyGruenbeckCloudError,
+    PyGruenbeckCloudResponseError,
     PyGruenbeckCloudResponseStatusError,
     PyGruenbeckCloudUpdateParameterError,
 )
 from pygruenbeck_cloud.models import Device
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, EVENT_HOMEASSISTANT_STOP
+from homeassistant.const import CONF_HOST, CONF_SCAN_INTERVAL, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import (
     CALLBACK_TYPE,
     Event,
@@ -25,18 +32,108 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .account import GruenbeckCloudAccount
+from .breaker import ENDPOINT_ERRORS, REQUEST_ERRORS, GruenbeckCloudCircuitBreaker
 from .const import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_MAX_RESET_TIMEOUT,
+    CIRCUIT_BREAKER_RESET_TIMEOUT,
+    CIRCUIT_CLOSED,
+    CIRCUIT_STATES,
     CONF_DEVICE_ID,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_PARAMETER_SCAN_INTERVAL,
+    CONF_UPDATE_COALESCE_WINDOW,
+    DEVICE_SECTIONS,
     DOMAIN,
+    FALLBACK_UPDATE_INTERVAL,
+    LOCAL_REQUEST_TIMEOUT,
+    LOCAL_UPDATE_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    PARAMETER_UPDATE_INTERVAL,
+    PARAMETER_WRITE_WINDOW,
+    PRIORITY_BACKGROUND,
+    PRIORITY_USER,
+    REFRESH_TIMEOUT,
+    REQUEST_TIMEOUT,
+    REQUEST_TIMEOUTS,
+    SERVICE_PARAM_END_DATE,
+    SERVICE_PARAM_FORCE_REFRESH,
     SERVICE_PARAM_PARAMETER,
+    SERVICE_PARAM_PARAMETERS,
+    SERVICE_PARAM_START_DATE,
     SERVICE_PARAM_VALUE,
+    TOKEN_REFRESH_BEFORE_EXPIRY,
+    TOKEN_REFRESH_RETRY,
+    UPDATE_COALESCE_WINDOW,
     UPDATE_INTERVAL,
+    WEBSOCKET_KEEPALIVE_INTERVAL,
+    WEBSOCKET_RECONNECT_DELAY,
+    WEBSOCKET_RECONNECT_MAX_ATTEMPTS,
+    WEBSOCKET_RECONNECT_MAX_DELAY,
+    WEBSOCKET_STALE_TIMEOUT,
+    WEBSOCKET_STALE_TIMEOUT_REGENERATION,
+    WEBSOCKET_WATCHDOG_INTERVAL,
 )
+from .local import GruenbeckLocalClient
+from .statistics import MEASUREMENT_STATISTICS, async_import_measurement_statistics
+from .storage import GruenbeckCloudStore
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Endpoints called by the regular refresh, without the optional ones
+POLL_ENDPOINTS = ("device", "infos", "parameters")
+
+
+@dataclass
+class MeasurementCacheEntry:
+    """Validity of the daily measurements fetched from API."""
+
+    valid_until: datetime
+    regeneration_counter: int | None
+
+
+def device_snapshot(device: Device) -> dict[str, Any]:
+    """Return the Device field values keyed by "<section>.<field>"."""
+    snapshot = {
+        f"device.{field.name}": getattr(device, field.name)
+        for field in fields(device)
+        if field.name not in DEVICE_SECTIONS and field.name != "logger"
+    }
+    for section in DEVICE_SECTIONS:
+        section_data = getattr(device, section)
+        snapshot.update(
+            {
+                f"{section}.{field.name}": getattr(section_data, field.name)
+                for field in fields(section_data)
+            }
+        )
+
+    return snapshot
+
+
+def _websocket_reconnect_delay(attempt: int) -> float:
+    """Return seconds to wait before the given WebSocket reconnect attempt."""
+    if attempt <= 1:
+        return 0
+
+    delay = min(
+        WEBSOCKET_RECONNECT_DELAY.total_seconds() * 2 ** (attempt - 2),
+        WEBSOCKET_RECONNECT_MAX_DELAY.total_seconds(),
+    )
+    # Jitter avoids all devices reconnecting at once after a cloud outage
+    return random.uniform(delay / 2, delay)
+
 
 class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
     """Grünbeck Cloud Coordinator."""
@@ -47,61 +144,328 @@ class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
         self,
         hass: HomeAssistant,
         config_entry: ConfigEntry,
+        account: GruenbeckCloudAccount,
+        store: GruenbeckCloudStore,
     ) -> None:
         """Initialize Coordinator."""
-        self.api = PyGruenbeckCloud(
-            username=config_entry.data[CONF_USERNAME],
-            password=config_entry.data[CONF_PASSWORD],
-        )
+        # Devices of the same account share login and HTTP session
+        self.account = account
+        self.store = store
+        self.api = account.create_api()
         self.api.logger = _LOGGER
         self._device_id = config_entry.data[CONF_DEVICE_ID]
+        # Realtime values are polled in the local network if a host is set
+        self.local: GruenbeckLocalClient | None = None
+        if host := config_entry.options.get(CONF_HOST):
+            # Not the account session, its cookies and request statistics
+            # belong to the cloud
+            self.local = GruenbeckLocalClient(
+                async_get_clientsession(hass), host, LOCAL_REQUEST_TIMEOUT
+            )
+        self.transport = "cloud"
 
         self.unsub: CALLBACK_TYPE | None = None
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=UPDATE_INTERVAL)
+        self._listen_task: asyncio.Task[None] | None = None
+        self.websocket_reconnect_attempts = 0
+        self.websocket_reconnect_successes = 0
+        self.websocket_stale_detections = 0
+        self._last_frame: float | None = None
+        self._watchdog_unsub: CALLBACK_TYPE | None = None
+        self._keepalive_unsub: CALLBACK_TYPE | None = None
+        self._token_refresh_unsub: CALLBACK_TYPE | None = None
+        # Parameter writes waiting for the coalescing window to end
+        self._pending_parameters: dict[str, Any] = {}
+        self._pending_writes: list[asyncio.Future[None]] = []
+        self._write_unsub: CALLBACK_TYPE | None = None
+        self._write_lock = asyncio.Lock()
+        # Batches of parameters being written
+        self._write_tasks: set[asyncio.Task[None]] = set()
+        # Pending requests shared by concurrent service calls
+        self._flights: dict[str, asyncio.Task[Any]] = {}
+        self.shared_flights: dict[str, int] = {}
+        self._measurement_cache: dict[str, MeasurementCacheEntry] = {}
+        self.measurement_cache_stats = {"hits": 0, "misses": 0}
+        self._statistics_imported: set[str] = set()
+        self._backfill_started = False
+        # Circuit breaker of each API endpoint, created on first use
+        self.circuit_breakers: dict[str, GruenbeckCloudCircuitBreaker] = {}
+        # API calls which had to wait for an expired token to be renewed
+        self.expired_token_calls = 0
+        # Duration in seconds of each API call of the last refresh
+        self.refresh_timings: dict[str, float] = {}
+        # Number of timed out API calls of refreshes per leg
+        self.refresh_timeouts: dict[str, int] = {}
+
+        # Parameters are cached and only refreshed at their own cadence
+        self._parameter_interval = timedelta(
+            seconds=config_entry.options.get(
+                CONF_PARAMETER_SCAN_INTERVAL,
+                PARAMETER_UPDATE_INTERVAL.total_seconds(),
+            )
+        )
+        self._parameters_updated: float | None = None
+        # Device infos are refreshed at the scan interval while polled locally
+        self._infos_updated: float | None = None
+
+        self._scan_interval = timedelta(
+            seconds=config_entry.options.get(
+                CONF_SCAN_INTERVAL, UPDATE_INTERVAL.total_seconds()
+            )
+        )
+        self._min_scan_interval = timedelta(
+            seconds=config_entry.options.get(
+                CONF_MIN_SCAN_INTERVAL, MIN_SCAN_INTERVAL.total_seconds()
+            )
+        )
+        self._max_scan_interval = timedelta(
+            seconds=config_entry.options.get(
+                CONF_MAX_SCAN_INTERVAL, MAX_SCAN_INTERVAL.total_seconds()
+            )
+        )
+        super().__init__(
+            hass, _LOGGER, name=DOMAIN, update_interval=self._scan_interval
+        )
+
+        # Coalesce bursts of WebSocket frames, the first update passes immediately
+        self._coalesce_window = config_entry.options.get(
+            CONF_UPDATE_COALESCE_WINDOW, UPDATE_COALESCE_WINDOW.total_seconds()
+        )
+        self._listeners_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=self._coalesce_window,
+            immediate=True,
+            function=self.async_update_listeners,
+        )
+        self.websocket_frames = 0
+
+        # Fields changed with the last listener update, None if unknown
+        self.changed_fields: set[str] | None = None
+        self._snapshot: dict[str, Any] = {}
+        self._notified_success = True
+        # Data restored from storage until the first successful refresh
+        self.stale = False
+        self._notified_stale = False
 
     async def disconnect(self) -> None:
         """Disconnect from API."""
-        await self.api.disconnect()
+        self._listeners_debouncer.async_cancel()
+        if self._write_unsub:
+            self._write_unsub()
+            self._write_unsub = None
+        for future in self._pending_writes:
+            future.cancel()
+        self._pending_parameters, self._pending_writes = {}, []
+        for task in self._write_tasks:
+            task.cancel()
+        # Callers of cancelled batches are released by the tasks themselves
+        await asyncio.gather(*self._write_tasks, return_exceptions=True)
+        if self._token_refresh_unsub:
+            self._token_refresh_unsub()
+            self._token_refresh_unsub = None
+        if self._watchdog_unsub:
+            self._watchdog_unsub()
+            self._watchdog_unsub = None
+        if self._keepalive_unsub:
+            self._keepalive_unsub()
+            self._keepalive_unsub = None
+        if self._listen_task:
+            listen_task, self._listen_task = self._listen_task, None
+            listen_task.cancel()
+            # The listener releases its stop listener, it is gone on return
+            with suppress(asyncio.CancelledError):
+                await listen_task
+        await self._async_disconnect_websocket()
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Return runtime statistics of the coordinator."""
+        cache = self.measurement_cache_stats
+        requests = cache["hits"] + cache["misses"]
+        return {
+            "refresh_timings": self.refresh_timings,
+            "refresh_timeouts": self.refresh_timeouts,
+            "parameters_expired": self.parameters_expired,
+            "stale": self.stale,
+            "transport": self.transport,
+            "circuit_breakers": {
+                endpoint: breaker.statistics
+                for endpoint, breaker in self.circuit_breakers.items()
+            },
+            "shared_flights": self.shared_flights,
+            "measurement_cache": {
+                **cache,
+                "hit_ratio": round(cache["hits"] / requests, 3) if requests else None,
+            },
+            "websocket": {
+                "connected": self.api.connected,
+                "reconnect_attempts": self.websocket_reconnect_attempts,
+                "reconnect_successes": self.websocket_reconnect_successes,
+                "stale_detections": self.websocket_stale_detections,
+                "frames": self.websocket_frames,
+                "seconds_since_last_frame": (
+                    round(time.monotonic() - self._last_frame)
+                    if self._last_frame is not None
+                    else None
+                ),
+            },
+            "update_interval": (
+                self.update_interval.total_seconds() if self.update_interval else None
+            ),
+            "update_interval_bounds": {
+                "min": self._min_scan_interval.total_seconds(),
+                "max": self._max_scan_interval.total_seconds(),
+            },
+            "account": {
+                "devices": self.account.references,
+                "logins": self.account.logins,
+                "expired_token_calls": self.expired_token_calls,
+                "rate_limiter": self.account.rate_limiter.statistics,
+                "connection_pool": self.account.pool_statistics,
+            },
+        }
+
+    @property
+    def infos_expired(self) -> bool:
+        """Return if device infos need to be refreshed from the cloud."""
+        if self._infos_updated is None:
+            return True
+
+        return (
+            time.monotonic() - self._infos_updated
+            >= self._scan_interval.total_seconds()
+        )
+
+    @property
+    def parameters_expired(self) -> bool:
+        """Return if cached device parameters need to be refreshed."""
+        if self._parameters_updated is None:
+            return True
+
+        return (
+            time.monotonic() - self._parameters_updated
+            >= self._parameter_interval.total_seconds()
+        )
+
+    @property
+    def circuit_state(self) -> str:
+        """Return the worst circuit breaker state of all endpoints."""
+        return max(
+            (breaker.state for breaker in self.circuit_breakers.values()),
+            key=CIRCUIT_STATES.index,
+            default=CIRCUIT_CLOSED,
+        )
+
+    @property
+    def local_healthy(self) -> bool:
+        """Return if realtime values can be polled in the local network."""
+        if self.local is None:
+            return False
+
+        breaker = self.circuit_breakers.get("local")
+        return breaker is None or breaker.state == CIRCUIT_CLOSED
+
+    @property
+    def regeneration_active(self) -> bool:
+        """Return if the device is currently regenerating."""
+        if self.data is None:
+            return False
+
+        return self.data.realtime.regeneration_step not in (None, 0)
+
+    @property
+    def push_healthy(self) -> bool:
+        """Return if WebSocket frames arrive within the expected cadence."""
+        if not self.api.connected or self._last_frame is None:
+            return False
+
+        timeout = (
+            WEBSOCKET_STALE_TIMEOUT_REGENERATION
+            if self.regeneration_active
+            else WEBSOCKET_STALE_TIMEOUT
+        )
+        return time.monotonic() - self._last_frame < timeout.total_seconds()
+
+    @callback
+    def invalidate_parameters(self) -> None:
+        """Force refresh of device parameters with the next update."""
+        self._parameters_updated = None
 
     @callback
     def _listen_websocket(self) -> None:
         """Listen to WebSocket updates."""
 
         async def listen() -> None:
-            """Listen for state changes."""
+            """Listen for state changes and reconnect on connection loss."""
+            attempt = 0
             try:
-                await self.api.connect()
-            except (PyGruenbeckCloudError, PyGruenbeckCloudResponseStatusError) as err:
-                self.logger.error(err)
+                while True:
+                    try:
+                        await self.api.connect()
+                    except (
+                        PyGruenbeckCloudConnectionError,
+                        PyGruenbeckCloudError,
+                        PyGruenbeckCloudResponseError,
+                        PyGruenbeckCloudResponseStatusError,
+                    ) as err:
+                        self.logger.error(err)
+                    except Exception:  # pylint: disable=broad-except
+                        self.logger.exception(
+                            "Unexpected error connecting to %s WebSocket", self.name
+                        )
+                    else:
+                        self._last_frame = time.monotonic()
+                        if attempt:
+                            self.websocket_reconnect_successes += 1
+                            self.logger.info("Reconnected to %s WebSocket", self.name)
+                        attempt = 0
+
+                        try:
+                            await self.api.listen(callback=self.async_set_updated_data)
+                        except (
+                            PyGruenbeckCloudConnectionError,
+                            PyGruenbeckCloudConnectionClosedError,
+                            PyGruenbeckCloudResponseError,
+                            PyGruenbeckCloudResponseStatusError,
+                        ) as err:
+                            self.last_update_success = False
+                            self.logger.error(err)
+                        except PyGruenbeckCloudError as err:
+                            self.last_update_success = False
+                            self.async_update_listeners()
+                            self.logger.error(err)
+                        except Exception:  # pylint: disable=broad-except
+                            self.last_update_success = False
+                            self.logger.exception(
+                                "Unexpected error listening to %s WebSocket", self.name
+                            )
+
+                    # Ensure we disconnect
+                    await self._async_disconnect_websocket()
+
+                    attempt += 1
+                    if attempt > WEBSOCKET_RECONNECT_MAX_ATTEMPTS:
+                        self.logger.error(
+                            "Unable to reconnect to %s WebSocket after %d attempts",
+                            self.name,
+                            WEBSOCKET_RECONNECT_MAX_ATTEMPTS,
+                        )
+                        break
+
+                    self.websocket_reconnect_attempts += 1
+                    await asyncio.sleep(_websocket_reconnect_delay(attempt))
+            finally:
+                # Next regular update starts a new listener
                 if self.unsub:
                     self.unsub()
                     self.unsub = None
-                return
-
-            try:
-                await self.api.listen(callback=self.async_set_updated_data)
-            except (
-                PyGruenbeckCloudConnectionError,
-                PyGruenbeckCloudConnectionClosedError,
-                PyGruenbeckCloudResponseStatusError,
-            ) as err:
-                self.last_update_success = False
-                self.logger.error(err)
-            except PyGruenbeckCloudError as err:
-                self.last_update_success = False
-                self.async_update_listeners()
-                self.logger.error(err)
-
-            # Ensure we disconnect
-            await self.api.disconnect()
-            if self.unsub:
-                self.unsub()
-                self.unsub = None
+                if self._listen_task is asyncio.current_task():
+                    self._listen_task = None
 
         async def close_websocket(_: Event) -> None:
             """Close WebSocket connection."""
             self.unsub = None
-            await self.api.disconnect()
+            await self.disconnect()
 
         # Clean disconnect WebSocket on Home Assistant shutdown
         self.unsub = self.hass.bus.async_listen_once(
@@ -109,17 +473,326 @@ class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
         )
 
         # Start listener
-        self.config_entry.async_create_background_task(
+        self._listen_task = self.config_entry.async_create_background_task(
             self.hass, listen(), "gruenbeck-cloud-listen"
         )
 
+        if not self._watchdog_unsub:
+            self._watchdog_unsub = async_track_time_interval(
+                self.hass, self._async_websocket_watchdog, WEBSOCKET_WATCHDOG_INTERVAL
+            )
+        if not self._keepalive_unsub:
+            self._keepalive_unsub = async_track_time_interval(
+                self.hass, self._async_websocket_keepalive, WEBSOCKET_KEEPALIVE_INTERVAL
+            )
+
+    @callback
+    def _async_websocket_watchdog(self, _: datetime) -> None:
+        """Detect a dead WebSocket connection which does not raise."""
+        healthy = self.push_healthy
+        self._update_polling_interval()
+        if healthy or not self.api.connected:
+            return
+
+        self.websocket_stale_detections += 1
+        self.logger.warning(
+            "No data received from %s WebSocket in time, reconnecting", self.name
+        )
+        self.config_entry.async_create_background_task(
+            self.hass, self._async_recover_websocket(), "gruenbeck-cloud-watchdog"
+        )
+
+    @callback
+    def _async_websocket_keepalive(self, _: datetime) -> None:
+        """Keep the data stream alive, independent of the polling interval."""
+        if not self.api.connected:
+            return
+
+        self.config_entry.async_create_background_task(
+            self.hass, self._async_refresh_sd(), "gruenbeck-cloud-keepalive"
+        )
+
+    async def _async_recover_websocket(self) -> None:
+        """Close a stale WebSocket and poll missed data."""
+        # The listener task notices the closed connection and reconnects
+        await self._async_disconnect_websocket()
+        await self.async_request_refresh()
+
+    @callback
+    def _update_polling_interval(self) -> None:
+        """Adapt the polling interval to WebSocket health and regeneration.
+
+        While WebSocket pushes data of an idle device, polling is rare. It is
+        faster while WebSocket does not push data, fastest during a
+        regeneration. A circuit of the polled endpoints which is not closed
+        backs off polling until the next trial request is allowed.
+        """
+        interval = self._scan_interval
+        if self.push_healthy:
+            if not self.regeneration_active:
+                interval = self._max_scan_interval
+        elif self.regeneration_active:
+            interval = self._min_scan_interval
+        else:
+            interval = min(interval, FALLBACK_UPDATE_INTERVAL)
+        interval = min(max(interval, self._min_scan_interval), self._max_scan_interval)
+
+        if self.local_healthy:
+            # Local polling is cheap, the cloud is called at its own cadence
+            interval = min(interval, LOCAL_UPDATE_INTERVAL)
+        else:
+            for breaker in self._polled_circuit_breakers():
+                interval = max(interval, breaker.reset_timeout)
+
+        if interval == self.update_interval:
+            return
+
+        self.logger.debug("Changing %s update interval to %s", self.name, interval)
+        previous, self.update_interval = self.update_interval, interval
+        # A refresh scheduled with a longer interval has to come earlier
+        if previous is not None and interval < previous and self._unsub_refresh:
+            self._schedule_refresh()
+
+    async def _async_disconnect_websocket(self) -> None:
+        """Disconnect WebSocket, ignoring errors of an already broken connection.
+
+        The library closes its WebSocket session without resetting it, the
+        next connect has to create a new one. Closing the session leaves an
+        upgraded connection open, so the connection is closed on its own.
+        """
+        # The listener may reconnect meanwhile, only the current ones are closed
+        # pylint: disable-next=protected-access
+        client, session = self.api._ws_client, self.api._ws_session
+        try:
+            await self.api.disconnect()
+        except REQUEST_ERRORS as err:
+            self.logger.debug("Error while disconnecting WebSocket: %s", err)
+        finally:
+            # pylint: disable=protected-access
+            if self.api._ws_session is session:
+                self.api._ws_session = None
+            if client is not None and not client.closed:
+                await client.close()
+            if session is not None and not session.closed:
+                await session.close()
+
+    def _circuit_breaker(self, endpoint: str) -> GruenbeckCloudCircuitBreaker:
+        """Return the circuit breaker of an API endpoint."""
+        if (breaker := self.circuit_breakers.get(endpoint)) is None:
+            breaker = self.circuit_breakers[endpoint] = GruenbeckCloudCircuitBreaker(
+                endpoint,
+                CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                CIRCUIT_BREAKER_RESET_TIMEOUT,
+                CIRCUIT_BREAKER_MAX_RESET_TIMEOUT,
+            )
+        return breaker
+
+    def _polled_circuit_breakers(self) -> list[GruenbeckCloudCircuitBreaker]:
+        """Return the breakers of polled endpoints which are not closed."""
+        return [
+            breaker
+            for endpoint in POLL_ENDPOINTS
+            if (breaker := self.circuit_breakers.get(endpoint)) is not None
+            and breaker.state != CIRCUIT_CLOSED
+        ]
+
+    async def _async_request(
+        self,
+        endpoint: str,
+        call: Callable[[], Awaitable[_T]],
+        priority: int = PRIORITY_BACKGROUND,
+        cloud: bool = True,
+    ) -> _T:
+        """Send an API request once the account rate limit allows it.
+
+        Cloud requests waiting for the account rate limit are served by
+        priority, local requests bypass it. Requests to an endpoint with an
+        open circuit fail immediately, a request exceeding the timeout of its
+        endpoint is cancelled.
+        """
+        breaker = self._circuit_breaker(endpoint)
+        breaker.before_request()
+        timeout = REQUEST_TIMEOUTS.get(endpoint, REQUEST_TIMEOUT)
+        try:
+            if cloud:
+                await self.account.rate_limiter.async_acquire(priority)
+            async with asyncio.timeout(timeout.total_seconds()):
+                result = await call()
+        except ENDPOINT_ERRORS:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.release_trial()
+            raise
+
+        breaker.record_success()
+        return result
+
+    async def _async_authenticate(self) -> None:
+        """Make sure the API uses a valid token before calling it."""
+        # pylint: disable-next=protected-access
+        token = self.api._auth_token
+        if token is not None and token.is_expired():
+            self.expired_token_calls += 1
+            self.logger.debug("%s API call has to wait for token renewal", self.name)
+
+        await self.account.async_authenticate(self.api)
+        self._schedule_token_refresh()
+
+    @callback
+    def _schedule_token_refresh(self, delay: timedelta | None = None) -> None:
+        """Schedule renewing the token before it expires."""
+        if self._token_refresh_unsub:
+            self._token_refresh_unsub()
+            self._token_refresh_unsub = None
+
+        if delay is None:
+            if (token := self.account.auth_token) is None:
+                return
+            delay = max(
+                token.expires_on - TOKEN_REFRESH_BEFORE_EXPIRY - datetime.now(),
+                timedelta(0),
+            )
+
+        self._token_refresh_unsub = async_call_later(
+            self.hass, delay, self._handle_token_refresh
+        )
+
+    @callback
+    def _handle_token_refresh(self, _now: datetime) -> None:
+        """Renew the token in background."""
+        self._token_refresh_unsub = None
+        self.config_entry.async_create_background_task(
+            self.hass, self._async_refresh_token(), "gruenbeck-cloud-token-refresh"
+        )
+
+    async def _async_refresh_token(self) -> None:
+        """Renew the token, so API calls never wait for it."""
+        try:
+            await self.account.async_authenticate(
+                self.api, renew_before=TOKEN_REFRESH_BEFORE_EXPIRY
+            )
+        except (
+            HomeAssistantError,
+            PyGruenbeckCloudConnectionError,
+            PyGruenbeckCloudError,
+            PyGruenbeckCloudResponseError,
+            PyGruenbeckCloudResponseStatusError,
+        ) as err:
+            self.logger.warning("Unable to renew %s token: %s", self.name, err)
+            self._schedule_token_refresh(TOKEN_REFRESH_RETRY)
+            return
+
+        self.store.async_save_auth_token(self.account.auth_token)
+        self._schedule_token_refresh()
+
+    async def _async_single_flight(
+        self, key: str, call: Callable[[], Coroutine[Any, Any, _T]]
+    ) -> _T:
+        """Share one pending API request between concurrent callers."""
+        # Eagerly started requests can be done before forgetting them
+        flight = self._flights.get(key)
+        if flight is not None and not flight.done():
+            self.shared_flights[key] = self.shared_flights.get(key, 0) + 1
+        else:
+            flight = self._flights[key] = self.hass.async_create_task(
+                call(), f"gruenbeck-cloud-{key}"
+            )
+
+            @callback
+            def flight_done(task: asyncio.Task[Any]) -> None:
+                """Forget the request, its error is retrieved if no caller waits."""
+                if self._flights.get(key) is task:
+                    del self._flights[key]
+                if not task.cancelled():
+                    task.exception()
+
+            flight.add_done_callback(flight_done)
+
+        # A cancelled caller must not cancel the request of the others
+        return cast(_T, await asyncio.shield(flight))
+
+    async def _async_update_measurements(
+        self, kind: str, force_refresh: bool = False, priority: int = PRIORITY_USER
+    ) -> None:
+        """Merge new daily salt or water measurements into the stored history."""
+        cached = self._measurement_cache.get(kind)
+        if (
+            not force_refresh
+            and cached is not None
+            and dt_util.now() < cached.valid_until
+            and cached.regeneration_counter == self.data.realtime.regeneration_counter
+        ):
+            self.measurement_cache_stats["hits"] += 1
+            return
+
+        self.measurement_cache_stats["misses"] += 1
+        device = await self._async_single_flight(
+            f"{kind}_measurements",
+            lambda: self._async_fetch_measurements(kind, priority),
+        )
+        self._merge_measurements(device, kind)
+
+        # Daily values only change with the next day or a regeneration
+        self._measurement_cache[kind] = MeasurementCacheEntry(
+            valid_until=dt_util.start_of_local_day() + timedelta(days=1),
+            regeneration_counter=self.data.realtime.regeneration_counter,
+        )
+
+    @callback
+    def _merge_measurements(self, device: Device, kind: str) -> None:
+        """Merge measurements into the history and its long-term statistics."""
+        changed = self.store.async_merge_measurements(kind, getattr(device, kind) or [])
+        self.logger.debug("Merged %d changed %s measurement days", changed, kind)
+        # The first import after startup backfills the stored history
+        if changed or kind not in self._statistics_imported:
+            async_import_measurement_statistics(self.hass, device, self.store, kind)
+            self._statistics_imported.add(kind)
+
+    async def _async_backfill_measurements(self) -> None:
+        """Fetch the full measurement history if none is stored yet."""
+        for kind in MEASUREMENT_STATISTICS:
+            if self.store.measurements(kind):
+                continue
+
+            try:
+                await self._async_update_measurements(
+                    kind, priority=PRIORITY_BACKGROUND
+                )
+            except (
+                HomeAssistantError,
+                PyGruenbeckCloudConnectionError,
+                PyGruenbeckCloudError,
+                PyGruenbeckCloudResponseError,
+                PyGruenbeckCloudResponseStatusError,
+            ) as err:
+                self.logger.warning(
+                    "Unable to fetch %s measurements of %s: %s", kind, self.name, err
+                )
+
+    async def _async_fetch_measurements(self, kind: str, priority: int) -> Device:
+        """Fetch salt or water measurements from API."""
+        await self._async_authenticate()
+        if kind == "salt":
+            return await self._async_request(
+                "measurements", self.api.get_device_salt_measurements, priority
+            )
+        return await self._async_request(
+            "measurements", self.api.get_device_water_measurements, priority
+        )
+
     async def service_get_device_salt_measurements(
         self, call: ServiceCall
     ) -> ServiceResponse:
         """Service to get Salt measurements."""
-        device = await self.api.get_device_salt_measurements()
-        if device.salt is None:
-            return {"entries": []}
+        await self._async_update_measurements(
+            "salt", call.data[SERVICE_PARAM_FORCE_REFRESH]
+        )
+        entries = self.store.measurements(
+            "salt",
+            call.data.get(SERVICE_PARAM_START_DATE),
+            call.data.get(SERVICE_PARAM_END_DATE),
+        )
 
         return {
             "entries": [
@@ -127,7 +800,7 @@ class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
                     "date": item.date.isoformat(),
                     "value": item.value,
                 }
-                for item in device.salt
+                for item in entries
             ],
         }
 
@@ -135,9 +808,14 @@ class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
         self, call: ServiceCall
     ) -> ServiceResponse:
         """Service to get Water measurements."""
-        device = await self.api.get_device_water_measurements()
-        if device.water is None:
-            return {"entries": []}
+        await self._async_update_measurements(
+            "water", call.data[SERVICE_PARAM_FORCE_REFRESH]
+        )
+        entries = self.store.measurements(
+            "water",
+            call.data.get(SERVICE_PARAM_START_DATE),
+            call.data.get(SERVICE_PARAM_END_DATE),
+        )
 
         return {
             "entries": [
@@ -145,40 +823,158 @@ class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
                     "date": item.date.isoformat(),
                     "value": item.value,
                 }
-                for item in device.water
+                for item in entries
             ],
         }
 
     async def service_regenerate(self, call: ServiceCall) -> None:
         """Service to start manual regeneration."""
-        await self.api.regenerate()
+        await self._async_authenticate()
+        await self._async_request("regenerate", self.api.regenerate, PRIORITY_USER)
 
-    async def service_change_settings(self, call: ServiceCall) -> None:
+    async def service_change_settings(self, call: ServiceCall) -> ServiceResponse:
         """Service for update device settings."""
-        data = {
-            call.data[SERVICE_PARAM_PARAMETER]: call.data[SERVICE_PARAM_VALUE],
-        }
+        data = dict(call.data.get(SERVICE_PARAM_PARAMETERS, {}))
+        if SERVICE_PARAM_PARAMETER in call.data:
+            data[call.data[SERVICE_PARAM_PARAMETER]] = call.data[SERVICE_PARAM_VALUE]
 
         await self.update_device_infos_parameters(data)
 
+        if not call.return_response:
+            return None
+
+        # Values as stored on the device after the write, times as ISO strings
+        values = {key: getattr(self.data.parameters, key) for key in data}
+        return {
+            "parameters": {
+                key: value.isoformat() if hasattr(value, "isoformat") else value
+                for key, value in values.items()
+            },
+        }
+
     async def update_device_infos_parameters(self, data: dict[str, Any]) -> None:
-        """Update Device parameters."""
+        """Update Device parameters.
+
+        Parameters of calls within a short window are merged and written
+        with a single API request, errors are raised to every caller.
+        """
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        self._pending_parameters.update(data)
+        self._pending_writes.append(future)
+        if self._write_unsub is None:
+            self._write_unsub = async_call_later(
+                self.hass, PARAMETER_WRITE_WINDOW, self._handle_parameter_write
+            )
+
+        await future
+
+    @callback
+    def _handle_parameter_write(self, _now: datetime) -> None:
+        """Write the parameters collected in the window."""
+        self._write_unsub = None
+        data, futures = self._pending_parameters, self._pending_writes
+        self._pending_parameters, self._pending_writes = {}, []
+        task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_write_parameters(data, futures),
+            "gruenbeck-cloud-parameter-write",
+        )
+        self._write_tasks.add(task)
+        task.add_done_callback(self._write_tasks.discard)
+
+    async def _async_write_parameters(
+        self, data: dict[str, Any], futures: list[asyncio.Future[None]]
+    ) -> None:
+        """Send merged parameters and resolve the waiting callers."""
+        self.logger.debug(
+            "Writing %d parameters of %d calls to %s",
+            len(data),
+            len(futures),
+            self.name,
+        )
         try:
-            self.data = await self.api.update_device_infos_parameters(data)
-        except PyGruenbeckCloudUpdateParameterError as err:
-            raise HomeAssistantError(err) from err
+            # Keep the order of batches, a later batch may change the same keys
+            async with self._write_lock:
+                await self._async_authenticate()
+                try:
+                    self.data = await self._async_request(
+                        "parameters",
+                        lambda: self.api.update_device_infos_parameters(data),
+                        PRIORITY_USER,
+                    )
+                except PyGruenbeckCloudUpdateParameterError as err:
+                    raise HomeAssistantError(err) from err
+                finally:
+                    self.invalidate_parameters()
+
+                # Pushed frames carry no parameters, only the REST response
+                # confirms a write. Dependent entities are notified at once.
+                self.async_update_listeners()
+        except Exception as err:  # pylint: disable=broad-except
+            for future in futures:
+                if not future.done():
+                    future.set_exception(err)
+        else:
+            for future in futures:
+                if not future.done():
+                    future.set_result(None)
+        finally:
+            # A cancelled write, e.g. on unload, must not keep its callers waiting
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+
+    @callback
+    def async_restore_data(self, device: Device) -> None:
+        """Use a device snapshot from storage until the API responds."""
+        device.logger = _LOGGER
+        self.data = device
+        self.stale = True
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners with the changed Device fields."""
+        snapshot = device_snapshot(self.data) if self.data is not None else {}
+        if (
+            not self._snapshot
+            or self.last_update_success != self._notified_success
+            or self.stale != self._notified_stale
+        ):
+            # Availability changed, every entity needs to be written
+            self.changed_fields = None
+        else:
+            changed = {
+                key
+                for key, value in snapshot.items()
+                if key not in self._snapshot or self._snapshot[key] != value
+            }
+            # Section names match entities reading properties of a section
+            self.changed_fields = changed | {key.split(".")[0] for key in changed}
+
+        self._snapshot = snapshot
+        self._notified_success = self.last_update_success
+        self._notified_stale = self.stale
+        super().async_update_listeners()
 
     @callback
     def async_set_updated_data(self, data: Device) -> None:
         """Manually update data from WebSocket, avoid stopping refresh interval."""
         self.data = data
         self.last_update_success = True
+        self._last_frame = time.monotonic()
+        # Pushed data can start or end a regeneration
+        self._update_polling_interval()
+
+        self.websocket_frames += 1
 
         self.logger.debug(
             "Manually updated %s data",
             self.name,
         )
-        self.async_update_listeners()
+        if self._coalesce_window > 0:
+            self._listeners_debouncer.async_schedule_call()
+        else:
+            self.async_update_listeners()
 
     async def _async_update_data(self) -> Device:
         """Update regularly data from API."""
@@ -188,23 +984,191 @@ class GruenbeckCloudCoordinator(DataUpdateCoordinator[Device]):
         )
 
         try:
-            if not self.api.device:
-                await self.api.set_device_from_id(self._device_id)
-            await self.api.get_device_infos()
-            device = await self.api.get_device_infos_parameters()
-
-            # Start listening to websocket at first time
-            if not self.api.connected and not self.unsub:
-                self._listen_websocket()
-            else:
-                await self.api.enter_sd()
-                await self.api.refresh_sd()
-
-            return device
+            try:
+                device = await self._async_fetch_device()
+            except PyGruenbeckCloudResponseStatusError:
+                # A token restored from storage may have been revoked meanwhile
+                if not self.account.discard_restored_auth_token():
+                    raise
+                device = await self._async_fetch_device()
+
+            self.account.token_restored = False
+            self.store.async_save_auth_token(self.account.auth_token)
+            self.store.async_save_device(device)
+            self.stale = False
         except (
             Exception,
             IndexError,
             KeyError,
             PyGruenbeckCloudResponseStatusError,
         ) as err:
+            if self.data is not None and any(
+                breaker.failures
+                for endpoint in POLL_ENDPOINTS
+                if (breaker := self.circuit_breakers.get(endpoint)) is not None
+            ):
+                # Keep the last known data while the cloud is unreachable, from
+                # the first failure on so entities do not flap until it opens
+                self.stale = True
             raise UpdateFailed(f"Unable to get data from API: {err}") from err
+        finally:
+            self._update_polling_interval()
+
+        # Device infos contain the measurements of the last days
+        for kind in MEASUREMENT_STATISTICS:
+            if getattr(device, kind) is not None:
+                self._merge_measurements(device, kind)
+
+        if not self._backfill_started:
+            # Long-term statistics need the history, fetch it once
+            self._backfill_started = True
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_backfill_measurements(),
+                "gruenbeck-cloud-backfill",
+            )
+
+        return device
+
+    async def _async_fetch_device(self) -> Device:
+        """Fetch device data from API."""
+        # Calls still running at the deadline are cancelled
+        deadline = self.hass.loop.time() + REFRESH_TIMEOUT.total_seconds()
+        start = time.monotonic()
+        self.refresh_timings = {}
+        if not self.api.device:
+            await self._async_timed(
+                "authenticate", self._async_authenticate(), deadline
+            )
+            await self._async_timed(
+                "device",
+                self._async_request(
+                    "device", lambda: self.api.set_device_from_id(self._device_id)
+                ),
+                deadline,
+            )
+
+        start_websocket = not self.api.connected and not self.unsub
+        refresh_parameters = self.parameters_expired
+
+        # Realtime values from the local network, the cloud is the fallback
+        local_updated = self.local is not None and await self._async_refresh_local(
+            deadline
+        )
+        self.transport = "local" if local_updated else "cloud"
+        refresh_infos = not local_updated or self.infos_expired
+        if refresh_infos or refresh_parameters:
+            try:
+                await self._async_timed(
+                    "authenticate", self._async_authenticate(), deadline
+                )
+            except REQUEST_ERRORS as err:
+                if not local_updated:
+                    raise
+                self.logger.warning(
+                    "Unable to log in to refresh %s from cloud: %s", self.name, err
+                )
+                refresh_infos = refresh_parameters = False
+
+        # Infos and parameters use independent endpoints. The legs run
+        # concurrently within the refresh deadline, user requests still get
+        # their rate limit tokens first.
+        legs: dict[str, Awaitable[Any]] = {}
+        if refresh_infos:
+            legs["infos"] = self._async_request("infos", self.api.get_device_infos)
+        if refresh_parameters:
+            legs["parameters"] = self._async_request(
+                "parameters", self.api.get_device_infos_parameters
+            )
+
+        results = dict(
+            zip(
+                legs,
+                await asyncio.gather(
+                    *(
+                        self._async_timed(leg, call, deadline)
+                        for leg, call in legs.items()
+                    ),
+                    return_exceptions=True,
+                ),
+            )
+        )
+        for leg, result in list(results.items()):
+            if not isinstance(result, BaseException):
+                continue
+            if not local_updated:
+                raise result
+
+            # Locally polled values are up to date, keep the cached ones
+            self.logger.warning(
+                "Unable to refresh %s of %s from cloud: %s", leg, self.name, result
+            )
+            if isinstance(result, PyGruenbeckCloudResponseStatusError):
+                # Log in again with the next refresh if a restored token was rejected
+                self.account.discard_restored_auth_token()
+            del results[leg]
+
+        # Without a refresh, the cached infos and parameters are kept by the
+        # API device
+        device = cast(Device, results.get("infos", self.api.device))
+        if "infos" in results:
+            self._infos_updated = time.monotonic()
+        if "parameters" in results:
+            device.parameters = cast(Device, results["parameters"]).parameters
+            self._parameters_updated = time.monotonic()
+
+        self.refresh_timings["total"] = round(time.monotonic() - start, 3)
+        self.logger.debug(
+            "Refresh of %s took %ss: %s",
+            self.name,
+            self.refresh_timings["total"],
+            self.refresh_timings,
+        )
+
+        # Start listening to websocket at first time
+        if start_websocket:
+            self._listen_websocket()
+
+        return device
+
+    async def _async_refresh_local(self, deadline: float) -> bool:
+        """Update realtime values from the local network, return if it worked."""
+        local = cast(GruenbeckLocalClient, self.local)
+        try:
+            values = await self._async_timed(
+                "local",
+                self._async_request("local", local.get_realtime, cloud=False),
+                deadline,
+            )
+        except REQUEST_ERRORS as err:
+            self.logger.debug(
+                "Unable to poll %s at %s, using cloud: %s", self.name, local.host, err
+            )
+            return False
+
+        cast(Device, self.api.device).update_from_http_response(values)
+        return True
+
+    async def _async_refresh_sd(self) -> None:
+        """Keep the WebSocket data stream of the device alive."""
+        try:
+            await self._async_request("sd", self.api.enter_sd)
+            await self._async_request("sd", self.api.refresh_sd)
+        except REQUEST_ERRORS as err:
+            # The watchdog reconnects if the data stream lapses
+            self.logger.debug("Unable to keep %s data stream alive: %s", self.name, err)
+
+    async def _async_timed(
+        self, leg: str, awaitable: Awaitable[_T], deadline: float
+    ) -> _T:
+        """Await an API call until the deadline and record how long it took."""
+        start = time.monotonic()
+        try:
+            async with asyncio.timeout_at(deadline):
+                return await awaitable
+        except TimeoutError as err:
+            self.refresh_timeouts[leg] = self.refresh_timeouts.get(leg, 0) + 1
+            msg = f"Timeout while refreshing {leg} of {self.name}"
+            raise TimeoutError(msg) from err
+        finally:
+            self.refresh_timings[leg] = round(time.monotonic() - start, 3)
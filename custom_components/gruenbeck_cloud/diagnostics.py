@@ -73,6 +73,7 @@ async def async_get_config_entry_diagnostics(
 
     # Get Diagnostics from API
     data["coordinator"] = await coordinator.api.get_diagnostics()  # type: ignore[assignment]
+    data["statistics"] = coordinator.statistics
 
     # Gather information how device is represented in Home Assistant
     device_registry = dr.async_get(hass)
@@ -0,0 +1,76 @@
+"""Local network access to the Grünbeck softener."""
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+import random
+from typing import Any
+
+from aiohttp import ClientSession, ClientTimeout
+from defusedxml import ElementTree
+from pygruenbeck_cloud.exceptions import PyGruenbeckCloudResponseError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Values of the local interface and the realtime field names used by the cloud
+LOCAL_REALTIME_FIELDS: dict[str, str] = {
+    # Flow rate exchanger 1 [m³/h]
+    "D_A_1_1": "mflow1",
+    # Remaining capacity exchanger 1 [m³]
+    "D_A_1_2": "mrescapa1",
+    # Capacity figure [m³x°dH]
+    "D_A_1_3": "mcapacity",
+    # Remaining amount / time of current regeneration step
+    "D_A_2_1": "mremregstep",
+    # Perform maintenance in [days]
+    "D_A_2_2": "mmaint",
+    # Current regeneration step, 0 if no regeneration is running
+    "D_Y_5": "mregstatus",
+}
+
+
+class GruenbeckLocalClient:
+    """Client polling realtime values from the device in the local network."""
+
+    def __init__(self, session: ClientSession, host: str, timeout: timedelta) -> None:
+        """Initialize local client."""
+        self._session = session
+        self.host = host
+        self._url = f"http://{host}/mux_http"
+        self._timeout = ClientTimeout(total=timeout.total_seconds())
+
+    async def get_realtime(self) -> dict[str, Any]:
+        """Return realtime values keyed by the realtime field names of the cloud."""
+        # The interface expects a random request ID and "~" terminated codes
+        data = {
+            "id": str(random.randint(1000, 9999)),
+            "show": "|".join(LOCAL_REALTIME_FIELDS) + "~",
+        }
+        async with self._session.post(
+            self._url, data=data, timeout=self._timeout
+        ) as response:
+            response.raise_for_status()
+            text = await response.text()
+
+        try:
+            root = ElementTree.fromstring(text)
+        except ElementTree.ParseError as err:
+            msg = f"Invalid response from {self.host}: {err}"
+            raise PyGruenbeckCloudResponseError(msg) from err
+
+        values: dict[str, Any] = {}
+        for code, field_name in LOCAL_REALTIME_FIELDS.items():
+            if (element := root.find(code)) is None or not element.text:
+                continue
+            try:
+                value = float(element.text)
+            except ValueError:
+                _LOGGER.debug("Ignoring invalid %s value: %s", code, element.text)
+                continue
+            values[field_name] = int(value) if value.is_integer() else value
+
+        if not values:
+            msg = f"No realtime values in response from {self.host}"
+            raise PyGruenbeckCloudResponseError(msg)
+
+        return values
@@ -1,15 +1,60 @@
 """Models for the Grünbeck Cloud integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import dataclasses
+from typing import Any, Protocol, cast
+
+from pygruenbeck_cloud.models import Device
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
+from .const import DEVICE_SECTIONS, DOMAIN, MANUFACTURER
 from .coordinator import GruenbeckCloudCoordinator
 
 
+class GruenbeckCloudValueDescription(Protocol):
+    """Entity description of the platforms, reading its value from a Device."""
+
+    value_fn: Callable[[Device], Any]
+
+
+class DeviceFieldTracer:
+    """Record which Device fields are read through it."""
+
+    def __init__(self, data: Any, section: str, accessed: set[str]) -> None:
+        """Initialize tracer for a Device or one of its sections."""
+        self._data = data
+        self._section = section
+        self._accessed = accessed
+        self._fields = {field.name for field in dataclasses.fields(data)}
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the real value and record the accessed field."""
+        value = getattr(self._data, name)
+        if self._section == "device" and name in DEVICE_SECTIONS:
+            return DeviceFieldTracer(value, name, self._accessed)
+
+        # Properties and methods can read any field of their section
+        if name in self._fields:
+            self._accessed.add(f"{self._section}.{name}")
+        else:
+            self._accessed.add(self._section)
+
+        return value
+
+
 class GruenbeckCloudEntity(CoordinatorEntity[GruenbeckCloudCoordinator]):
     """Base Grünbeck Cloud Entity class."""
 
     _attr_has_entity_name = True
+    # Device fields the entity state is built from, None if unknown
+    _source_fields: set[str] | None = None
+    # Requested value shown until the pending write is confirmed
+    _optimistic_value: Any = None
+    _pending_write: object | None = None
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -23,3 +68,93 @@ class GruenbeckCloudEntity(CoordinatorEntity[GruenbeckCloudCoordinator]):
             hw_version=self.coordinator.data.hardware_version,
             sw_version=self.coordinator.data.software_version,
         )
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available, keep restored data until refreshed."""
+        return super().available or self.coordinator.stale
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return if the state is restored from storage or a write is pending."""
+        return self.coordinator.stale or self._pending_write is not None
+
+    def _current_value(self) -> Any:
+        """Return the value to show, the requested one while writing it."""
+        if self._pending_write is not None:
+            return self._optimistic_value
+
+        return self._device_value()
+
+    def _device_value(self) -> Any:
+        """Return the value of the entity description from the device data."""
+        description = cast(GruenbeckCloudValueDescription, self.entity_description)
+        return description.value_fn(self.coordinator.data)
+
+    async def _async_update_parameters(self, data: dict[str, Any], value: Any) -> None:
+        """Write parameters, showing the requested value immediately.
+
+        On success the state is reconciled with the returned Device, on
+        failure it rolls back to the last known value.
+        """
+        pending_write = self._pending_write = object()
+        self._optimistic_value = value
+        self.async_write_ha_state()
+        try:
+            await self.coordinator.update_device_infos_parameters(data)
+        finally:
+            # A newer write of the same entity keeps its optimistic value
+            if self._pending_write is pending_write:
+                self._pending_write = None
+                self._optimistic_value = None
+                self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self._source_fields, _ = self._trace_source_fields()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data, skip it if none of our source fields changed."""
+        changed = self.coordinator.changed_fields
+        if (
+            changed is not None
+            and self._source_fields is not None
+            and self._source_fields.isdisjoint(changed)
+        ):
+            return
+
+        # Fields read can change with the data, e.g. on fallback values
+        self._source_fields, value = self._trace_source_fields()
+        if changed is not None and self._pending_write is not None:
+            if self._source_fields is None:
+                value = self._device_value()
+            if value != self._optimistic_value:
+                # Device reported another value while writing, drop requested one
+                self._pending_write = None
+                self._optimistic_value = None
+
+        super()._handle_coordinator_update()
+
+    def _trace_source_fields(self) -> tuple[set[str] | None, Any]:
+        """Return Device fields read by the entity description functions.
+
+        The value returned by value_fn is passed along, the fields are None if
+        the functions are unable to be traced.
+        """
+        value_fn = getattr(self.entity_description, "value_fn", None)
+        extra_attr_fn = getattr(self.entity_description, "extra_attr_fn", None)
+        accessed: set[str] = set()
+        tracer = cast(
+            Device, DeviceFieldTracer(self.coordinator.data, "device", accessed)
+        )
+        try:
+            value = value_fn(tracer) if value_fn is not None else None
+            if extra_attr_fn is not None:
+                extra_attr_fn(tracer)
+        except Exception:  # pylint: disable=broad-except
+            # Always update entities we are unable to trace
+            return None, None
+
+        return accessed, value
@@ -551,7 +551,7 @@ class GruenbeckCloudNumberEntity(GruenbeckCloudEntity, NumberEntity):
     @property
     def native_value(self) -> float | None:
         """Return the state of our sensor."""
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self._current_value()
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
@@ -562,5 +562,4 @@ class GruenbeckCloudNumberEntity(GruenbeckCloudEntity, NumberEntity):
                 self.entity_id,
             )
             return
-        await self.coordinator.update_device_infos_parameters(new_value)
-        self.async_write_ha_state()
+        await self._async_update_parameters(new_value, value)
@@ -241,11 +241,10 @@ class GruenbeckCloudSelectEntity(GruenbeckCloudEntity, SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return the selected entity option to represent the entity state."""
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self._current_value()
 
     async def async_select_option(self, option: str) -> None:
         """Update the current selected option."""
-        await self.coordinator.update_device_infos_parameters(
-            self.entity_description.update_fn(self.coordinator.data, option)
+        await self._async_update_parameters(
+            self.entity_description.update_fn(self.coordinator.data, option), option
         )
-        self.async_write_ha_state()
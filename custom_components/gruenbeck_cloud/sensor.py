@@ -27,11 +27,19 @@ from homeassistant.const import (
     UnitOfVolume,
     UnitOfVolumeFlowRate,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import StateType
 
-from .const import DOMAIN, UNIT_OF_DH, UNIT_OF_L_HOUR, UNIT_OF_M3_X_DH
+from .const import (
+    CIRCUIT_OPEN,
+    CIRCUIT_STATES,
+    DOMAIN,
+    UNIT_OF_DH,
+    UNIT_OF_L_HOUR,
+    UNIT_OF_M3_X_DH,
+)
 from .coordinator import GruenbeckCloudCoordinator
 from .models import GruenbeckCloudEntity
 
@@ -96,11 +104,6 @@ SENSORS: tuple[GruenbeckCloudEntityDescription, ...] = (
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL_INCREASING,
         value_fn=lambda device: device.realtime.soft_water_quantity,
-        extra_attr_fn=lambda device: {
-            "daily_usage": [daily.to_dict() for daily in device.water]  # type: ignore[attr-defined]  # noqa: E501
-            if device.water is not None
-            else None
-        },
     ),
     # Regeneration counter
     GruenbeckCloudEntityDescription(
@@ -149,11 +152,6 @@ SENSORS: tuple[GruenbeckCloudEntityDescription, ...] = (
         # TOTAL_INCREASING and WEIGHT is not possible
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: device.realtime.salt_consumption,
-        extra_attr_fn=lambda device: {
-            "daily_usage": [daily.to_dict() for daily in device.salt]  # type: ignore[attr-defined]  # noqa: E501
-            if device.salt is not None
-            else None
-        },
     ),
     # Regeneration step
     GruenbeckCloudEntityDescription(
@@ -371,6 +369,7 @@ async def async_setup_entry(
         for description in SENSORS
         if description.exists_fn(coordinator.data)
     )
+    add_entities([GruenbeckCloudCircuitBreakerSensorEntity(coordinator)])
 
 
 class GruenbeckCloudSensorEntity(GruenbeckCloudEntity, SensorEntity):
@@ -397,3 +396,90 @@ class GruenbeckCloudSensorEntity(GruenbeckCloudEntity, SensorEntity):
     def extra_state_attributes(self):
         """Return the state attributes."""
         return self.entity_description.extra_attr_fn(self.coordinator.data)
+
+
+class GruenbeckCloudCircuitBreakerSensorEntity(GruenbeckCloudEntity, SensorEntity):
+    """Define a sensor showing the circuit breaker state of the API endpoints."""
+
+    entity_description = SensorEntityDescription(
+        key="circuit_breaker",
+        translation_key="circuit_breaker",
+        device_class=SensorDeviceClass.ENUM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        options=list(CIRCUIT_STATES),
+    )
+
+    def __init__(self, coordinator: GruenbeckCloudCoordinator) -> None:
+        """Initialize our circuit breaker sensor entity."""
+        super().__init__(coordinator=coordinator)
+        self._attr_unique_id = (
+            f"{coordinator.data.serial_number}_{self.entity_description.key}"
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available, an open circuit is shown as well."""
+        return True
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return if the state is assumed, never for the breaker state."""
+        return False
+
+    @property
+    def native_value(self) -> str:
+        """Return the worst state of all circuits."""
+        return self.coordinator.circuit_state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, str]:
+        """Return the state of each circuit."""
+        return {
+            endpoint: breaker.state
+            for endpoint, breaker in self.coordinator.circuit_breakers.items()
+        }
+
+    _unsub_half_open: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_half_open)
+        self._async_schedule_half_open()
+
+    @callback
+    def _async_cancel_half_open(self) -> None:
+        """Cancel the scheduled half-open update."""
+        if self._unsub_half_open is not None:
+            self._unsub_half_open()
+            self._unsub_half_open = None
+
+    @callback
+    def _async_schedule_half_open(self) -> None:
+        """Update the state once the next open circuit becomes half-open.
+
+        Open circuits turn half-open with time, not with coordinator updates.
+        """
+        self._async_cancel_half_open()
+        retry_in = [
+            breaker.retry_in
+            for breaker in self.coordinator.circuit_breakers.values()
+            if breaker.state == CIRCUIT_OPEN
+        ]
+        if retry_in:
+            self._unsub_half_open = async_call_later(
+                self.hass, min(retry_in), self._async_half_open
+            )
+
+    @callback
+    def _async_half_open(self, _now: datetime) -> None:
+        """Write the state of a circuit which turned half-open."""
+        self._unsub_half_open = None
+        self._async_schedule_half_open()
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data, the breaker state is not part of it."""
+        self._async_schedule_half_open()
+        self.async_write_ha_state()
@@ -6,6 +6,7 @@ from homeassistant.core import HomeAssistant, SupportsResponse, callback
 
 from .const import (
     DOMAIN,
+    SERVICE_GET_MEASUREMENTS_SCHEMA,
     SERVICE_GET_SALT_MEASUREMENTS,
     SERVICE_GET_WATER_MEASUREMENTS,
     SERVICE_REGENERATE,
@@ -28,6 +29,7 @@ def register_services(
         SERVICE_UPDATE_DEVICE_PARAMETERS,
         coordinator.service_change_settings,
         schema=SERVICE_UPDATE_DEVICE_PARAMETERS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     hass.services.async_register(
@@ -40,6 +42,7 @@ def register_services(
         DOMAIN,
         SERVICE_GET_SALT_MEASUREMENTS,
         coordinator.service_get_device_salt_measurements,
+        schema=SERVICE_GET_MEASUREMENTS_SCHEMA,
         supports_response=SupportsResponse.ONLY,
     )
 
@@ -47,5 +50,6 @@ def register_services(
         DOMAIN,
         SERVICE_GET_WATER_MEASUREMENTS,
         coordinator.service_get_device_water_measurements,
+        schema=SERVICE_GET_MEASUREMENTS_SCHEMA,
         supports_response=SupportsResponse.ONLY,
     )
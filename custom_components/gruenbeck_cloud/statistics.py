@@ -0,0 +1,80 @@
+"""Long-term statistics for Grünbeck Cloud integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any, cast
+
+from pygruenbeck_cloud.models import Device
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import UnitOfMass, UnitOfVolume
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN
+from .storage import GruenbeckCloudStore
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # Home Assistant before 2025.4 only knows has_mean
+    NO_MEAN: dict[str, Any] = {"has_mean": False}
+else:
+    NO_MEAN = {"mean_type": StatisticMeanType.NONE}
+
+_LOGGER = logging.getLogger(__name__)
+
+# Name and unit of the daily measurements, salt is reported in grams per day
+MEASUREMENT_STATISTICS: dict[str, tuple[str, str]] = {
+    "salt": ("Daily salt usage", UnitOfMass.GRAMS),
+    "water": ("Daily soft water usage", UnitOfVolume.LITERS),
+}
+
+
+def statistic_id(device: Device, kind: str) -> str:
+    """Return the statistic ID of a measurement kind of the device."""
+    return f"{DOMAIN}:{slugify(device.serial_number)}_{kind}_daily_usage"
+
+
+@callback
+def async_import_measurement_statistics(
+    hass: HomeAssistant, device: Device, store: GruenbeckCloudStore, kind: str
+) -> None:
+    """Import the stored daily measurements as external statistics.
+
+    The whole stored history is imported, the recorder updates rows that
+    already exist, so changed days and their following sums are corrected.
+    """
+    entries = store.measurements(kind)
+    if not entries:
+        return
+
+    name, unit = MEASUREMENT_STATISTICS[kind]
+    metadata = cast(
+        StatisticMetaData,
+        {
+            **NO_MEAN,
+            "has_sum": True,
+            "name": f"{device.name} {name}",
+            "source": DOMAIN,
+            "statistic_id": statistic_id(device, kind),
+            "unit_of_measurement": unit,
+        },
+    )
+
+    total = 0
+    statistics: list[StatisticData] = []
+    for entry in entries:
+        total += entry.value
+        statistics.append(
+            StatisticData(
+                start=dt_util.start_of_local_day(entry.date),
+                state=entry.value,
+                sum=total,
+            )
+        )
+
+    _LOGGER.debug(
+        "Importing %d days into %s", len(statistics), metadata["statistic_id"]
+    )
+    async_add_external_statistics(hass, metadata, statistics)
@@ -0,0 +1,209 @@
+"""Local storage for Grünbeck Cloud integration."""
+from __future__ import annotations
+
+import dataclasses
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+import logging
+import types
+from typing import Any, Union, cast, get_args, get_origin, get_type_hints
+
+from pygruenbeck_cloud.models import DailyUsageEntry, Device, GruenbeckAuthToken
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    STORAGE_DEVICE_SAVE_DELAY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _encode(value: Any) -> Any:
+    """Convert a device value to JSON compatible data."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: _encode(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+            if field.name != "logger"
+        }
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, date | time):
+        return value.isoformat()
+    if isinstance(value, tzinfo):
+        offset = value.utcoffset(None)
+        return offset.total_seconds() if offset is not None else None
+    return value
+
+
+def _decode(hint: Any, value: Any) -> Any:
+    """Convert JSON data back to the device value of the given type."""
+    if value is None:
+        return None
+    if get_origin(hint) in (Union, types.UnionType):
+        hint = next(arg for arg in get_args(hint) if arg is not type(None))
+    if get_origin(hint) is list:
+        return [_decode(get_args(hint)[0], item) for item in value]
+    if dataclasses.is_dataclass(hint):
+        hints = get_type_hints(hint)
+        return cast(type[Any], hint)(
+            **{
+                field.name: _decode(hints[field.name], value[field.name])
+                for field in dataclasses.fields(hint)
+                if field.name in value
+            }
+        )
+    if hint in (datetime, date, time):
+        return hint.fromisoformat(value)
+    if hint is tzinfo:
+        return timezone(timedelta(seconds=value))
+    return value
+
+
+class GruenbeckCloudStore:
+    """Data of a config entry kept across restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize store."""
+        # Private store, the file is only readable by Home Assistant
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}", private=True
+        )
+        self.data: dict[str, Any] = {}
+        # Event loop time the pending write is due at
+        self._save_due: float | None = None
+        self._hass = hass
+
+        # Daily measurements per kind, keyed by ISO date. Kept separately as
+        # they change once a day while the other data changes with each poll.
+        self._history_store: Store[dict[str, dict[str, int]]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.history"
+        )
+        self.history: dict[str, dict[str, int]] = {}
+
+    async def async_load(self) -> None:
+        """Load stored data."""
+        self.data = await self._store.async_load() or {}
+        self.history = await self._history_store.async_load() or {}
+
+    async def async_remove(self) -> None:
+        """Remove stored data."""
+        await self._store.async_remove()
+        await self._history_store.async_remove()
+
+    @callback
+    def _async_schedule_save(self, delay: float = STORAGE_SAVE_DELAY) -> None:
+        """Schedule writing the data to disk, keep an earlier pending write."""
+        due = self._hass.loop.time() + delay
+        if self._save_due is not None and self._save_due <= due:
+            return
+
+        self._save_due = due
+        self._store.async_delay_save(self._data_to_save, delay)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return data to write to disk."""
+        self._save_due = None
+        return self.data
+
+    @property
+    def auth_token(self) -> GruenbeckAuthToken | None:
+        """Return stored auth token."""
+        if (token := self.data.get("auth_token")) is None:
+            return None
+
+        try:
+            return GruenbeckAuthToken(
+                access_token=token["access_token"],
+                refresh_token=token["refresh_token"],
+                not_before=datetime.fromisoformat(token["not_before"]),
+                expires_on=datetime.fromisoformat(token["expires_on"]),
+                expires_in=token["expires_in"],
+                tenant=token["tenant"],
+            )
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Ignoring invalid stored auth token: %s", err)
+            return None
+
+    @callback
+    def async_save_auth_token(self, token: GruenbeckAuthToken | None) -> None:
+        """Store auth token if it changed."""
+        if token is None:
+            return
+
+        stored = self.data.get("auth_token") or {}
+        if (
+            stored.get("access_token") == token.access_token
+            and stored.get("refresh_token") == token.refresh_token
+        ):
+            return
+
+        self.data["auth_token"] = {
+            "access_token": token.access_token,
+            "refresh_token": token.refresh_token,
+            "not_before": token.not_before.isoformat(),
+            "expires_on": token.expires_on.isoformat(),
+            "expires_in": token.expires_in,
+            "tenant": token.tenant,
+        }
+        self._async_schedule_save()
+
+    @property
+    def device(self) -> Device | None:
+        """Return last stored device snapshot."""
+        if (device := self.data.get("device")) is None:
+            return None
+
+        try:
+            return _decode(Device, device)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Ignoring invalid stored device snapshot: %s", err)
+            return None
+
+    @callback
+    def async_save_device(self, device: Device) -> None:
+        """Store device snapshot if it changed."""
+        if (snapshot := _encode(device)) == self.data.get("device"):
+            return
+
+        self.data["device"] = snapshot
+        self._async_schedule_save(STORAGE_DEVICE_SAVE_DELAY)
+
+    def measurements(
+        self, kind: str, start: date | None = None, end: date | None = None
+    ) -> list[DailyUsageEntry]:
+        """Return stored daily measurements, optionally within a date range."""
+        entries = [
+            DailyUsageEntry(value=value, date=date.fromisoformat(day))
+            for day, value in sorted(self.history.get(kind, {}).items())
+        ]
+        return [
+            entry
+            for entry in entries
+            if (start is None or entry.date >= start)
+            and (end is None or entry.date <= end)
+        ]
+
+    @callback
+    def async_merge_measurements(
+        self, kind: str, entries: list[DailyUsageEntry]
+    ) -> int:
+        """Merge fetched daily measurements, return number of changed days."""
+        history = self.history.setdefault(kind, {})
+        changed = 0
+        for entry in entries:
+            day = entry.date.isoformat()
+            if history.get(day) != entry.value:
+                history[day] = entry.value
+                changed += 1
+
+        if changed:
+            self._history_store.async_delay_save(
+                lambda: self.history, STORAGE_SAVE_DELAY
+            )
+        return changed
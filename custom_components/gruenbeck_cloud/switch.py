@@ -179,7 +179,7 @@ class GruenbeckCloudSwitchEntity(GruenbeckCloudEntity, SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if entity is on."""
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self._current_value()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
@@ -198,5 +198,4 @@ class GruenbeckCloudSwitchEntity(GruenbeckCloudEntity, SwitchEntity):
                 self.entity_id,
             )
             return
-        await self.coordinator.update_device_infos_parameters(new_value)
-        self.async_write_ha_state()
+        await self._async_update_parameters(new_value, value)
@@ -100,7 +100,7 @@ class GruenbeckCloudTextEntity(GruenbeckCloudEntity, TextEntity):
     @property
     def native_value(self) -> str | None:
         """Return the state of our sensor."""
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self._current_value()
 
     async def async_set_native_value(self, value: str) -> None:
         """Set new value."""
@@ -111,5 +111,4 @@ class GruenbeckCloudTextEntity(GruenbeckCloudEntity, TextEntity):
                 self.entity_id,
             )
             return
-        await self.coordinator.update_device_infos_parameters(new_value)
-        self.async_write_ha_state()
+        await self._async_update_parameters(new_value, value)
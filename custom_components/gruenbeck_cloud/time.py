@@ -242,7 +242,7 @@ class GruenbeckCloudTimeEntity(GruenbeckCloudEntity, TimeEntity):
     @property
     def native_value(self) -> datetime.time | None:
         """Return the state of our sensor."""
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self._current_value()
 
     async def async_set_value(self, value: datetime.time) -> None:
         """Set new value."""
@@ -253,5 +253,4 @@ class GruenbeckCloudTimeEntity(GruenbeckCloudEntity, TimeEntity):
                 self.entity_id,
             )
             return
-        await self.coordinator.update_device_infos_parameters(new_value)
-        self.async_write_ha_state()
+        await self._async_update_parameters(new_value, value)
@@ -0,0 +1 @@
+"""Tests for the Grünbeck Cloud integration."""
@@ -0,0 +1,73 @@
+"""Fixtures for Grünbeck Cloud integration tests."""
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+from pygruenbeck_cloud.models import Device
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.gruenbeck_cloud.account import (
+    async_get_account,
+    async_release_account,
+)
+from custom_components.gruenbeck_cloud.const import CONF_DEVICE_ID, DOMAIN
+from custom_components.gruenbeck_cloud.coordinator import GruenbeckCloudCoordinator
+from custom_components.gruenbeck_cloud.storage import GruenbeckCloudStore
+from homeassistant.config_entries import current_entry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+DEVICE_ID = "softliQ.D/BS12345678"
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return a config entry of a device."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_USERNAME: "user@example.com",
+            CONF_PASSWORD: "secret",
+            CONF_DEVICE_ID: DEVICE_ID,
+        },
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+def device() -> Device:
+    """Return a device as returned by the API."""
+    return Device(
+        type=18,
+        has_error=False,
+        id=DEVICE_ID,
+        series="softliQ.D",
+        serial_number="BS12345678",
+        name="softliQ:SD18",
+        register=True,
+    )
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, config_entry: MockConfigEntry
+) -> AsyncGenerator[GruenbeckCloudCoordinator]:
+    """Return a coordinator of the device, disconnected after the test."""
+    current_entry.set(config_entry)
+    account = async_get_account(
+        hass, config_entry.data[CONF_USERNAME], config_entry.data[CONF_PASSWORD]
+    )
+    coordinator = GruenbeckCloudCoordinator(
+        hass,
+        config_entry=config_entry,
+        account=account,
+        store=GruenbeckCloudStore(hass, config_entry.entry_id),
+    )
+
+    yield coordinator
+
+    await coordinator.disconnect()
+    await async_release_account(hass, account)
+    await hass.async_block_till_done(wait_background_tasks=True)
@@ -0,0 +1,442 @@
+"""Tests for the Grünbeck Cloud coordinator."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+import gc
+import time
+from typing import Any
+from unittest.mock import AsyncMock, Mock, PropertyMock, patch
+
+from aiohttp import ClientError, ClientSession, web
+from freezegun.api import FrozenDateTimeFactory
+from pygruenbeck_cloud.exceptions import (
+    PyGruenbeckCloudConnectionError,
+    PyGruenbeckCloudUpdateParameterError,
+)
+from pygruenbeck_cloud.models import DailyUsageEntry, Device
+import pytest
+from pytest_aiohttp import AiohttpServer
+
+from custom_components.gruenbeck_cloud.const import (
+    CIRCUIT_CLOSED,
+    PRIORITY_BACKGROUND,
+    PRIORITY_USER,
+    WEBSOCKET_STALE_TIMEOUT,
+)
+from custom_components.gruenbeck_cloud.coordinator import GruenbeckCloudCoordinator
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+
+async def wait_until(condition: Callable[[], bool]) -> None:
+    """Wait for a condition to become true."""
+    async with asyncio.timeout(5):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_websocket_watchdog_reconnects(
+    aiohttp_server: AiohttpServer, coordinator: GruenbeckCloudCoordinator
+) -> None:
+    """Test a stale WebSocket is replaced by a new connection."""
+    connections: asyncio.Queue[web.WebSocketResponse] = asyncio.Queue()
+
+    async def handle(request: web.Request) -> web.WebSocketResponse:
+        """Accept a connection which never sends a frame."""
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        connections.put_nowait(websocket)
+        async for _ in websocket:
+            pass
+        return websocket
+
+    app = web.Application()
+    app.router.add_get("/client/", handle)
+    server = await aiohttp_server(app)
+    ws_connect = ClientSession.ws_connect
+
+    def connect_test_server(session: ClientSession, url: Any, **kwargs: Any) -> Any:
+        """Connect to the test server instead of the cloud."""
+        return ws_connect(session, server.make_url("/client/"), **kwargs)
+
+    api = coordinator.api
+    with (
+        patch.object(ClientSession, "ws_connect", connect_test_server),
+        patch.object(api, "_get_ws_tokens", AsyncMock(return_value=["a", "b"])),
+        patch.object(api, "enter_sd", AsyncMock()),
+        patch.object(api, "refresh_sd", AsyncMock()),
+        patch.object(api, "leave_sd", AsyncMock()),
+        patch.object(
+            coordinator, "async_request_refresh", AsyncMock()
+        ) as request_refresh,
+    ):
+        coordinator._listen_websocket()
+        first = await asyncio.wait_for(connections.get(), 5)
+        await wait_until(lambda: coordinator._last_frame is not None)
+
+        # No frame arrived in time
+        coordinator._last_frame = (
+            time.monotonic() - WEBSOCKET_STALE_TIMEOUT.total_seconds() - 1
+        )
+        coordinator._async_websocket_watchdog(dt_util.utcnow())
+
+        second = await asyncio.wait_for(connections.get(), 5)
+        await wait_until(lambda: coordinator.websocket_reconnect_successes == 1)
+        assert second is not first
+        assert api.connected
+        assert coordinator.websocket_stale_detections == 1
+        request_refresh.assert_awaited_once()
+
+        await coordinator.disconnect()
+
+
+async def test_refresh_legs_run_concurrently(
+    coordinator: GruenbeckCloudCoordinator, device: Device
+) -> None:
+    """Test slow refresh legs share the refresh deadline instead of adding up."""
+    running = 0
+    max_running = 0
+
+    def slow_endpoint(result: Any = None) -> AsyncMock:
+        """Return an API call answering after a delay."""
+
+        async def call() -> Any:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            try:
+                await asyncio.sleep(0.3)
+            finally:
+                running -= 1
+            return result
+
+        return AsyncMock(side_effect=call)
+
+    api = coordinator.api
+    api._device = device
+    # A WebSocket listener is running already, the refresh starts none
+    coordinator.unsub = Mock()
+    with (
+        patch.object(coordinator, "_async_authenticate", AsyncMock()),
+        patch.object(api, "get_device_infos", slow_endpoint(device)),
+        patch.object(api, "get_device_infos_parameters", slow_endpoint(device)),
+        patch(
+            "custom_components.gruenbeck_cloud.coordinator.REFRESH_TIMEOUT",
+            timedelta(seconds=0.5),
+        ),
+    ):
+        assert await coordinator._async_fetch_device() is device
+
+    # Back to back, the two calls would take 0.6s
+    assert max_running == 2
+    assert coordinator.refresh_timeouts == {}
+    assert coordinator.refresh_timings["total"] < 0.5
+
+
+async def test_pushed_data_does_not_confirm_writes(
+    coordinator: GruenbeckCloudCoordinator, device: Device
+) -> None:
+    """Test a rejected write keeps the parameter although a frame matched it."""
+    coordinator.data = device
+    device.parameters.soft_water_hardness = 4
+    sent = asyncio.Event()
+    rejected = asyncio.Event()
+
+    async def update_parameters(data: dict[str, Any]) -> Device:
+        sent.set()
+        await rejected.wait()
+        raise PyGruenbeckCloudUpdateParameterError("Invalid value")
+
+    api = coordinator.api
+    with (
+        patch.object(coordinator, "_async_authenticate", AsyncMock()),
+        patch.object(
+            api, "update_device_infos_parameters", side_effect=update_parameters
+        ),
+        patch(
+            "custom_components.gruenbeck_cloud.coordinator.PARAMETER_WRITE_WINDOW",
+            timedelta(0),
+        ),
+    ):
+        write = asyncio.create_task(
+            coordinator.update_device_infos_parameters({"soft_water_hardness": 6})
+        )
+        await sent.wait()
+        # The measured hardness happens to match the written setting
+        device.realtime.actual_value_soft_water_hardness = 6
+        coordinator.async_set_updated_data(device)
+        rejected.set()
+        with pytest.raises(HomeAssistantError):
+            await write
+
+    assert coordinator.data.parameters.soft_water_hardness == 4
+
+
+async def test_first_failures_keep_stale_data(
+    coordinator: GruenbeckCloudCoordinator, device: Device
+) -> None:
+    """Test entities keep the last data before the circuit opens."""
+    coordinator.data = device
+
+    async def fetch_device() -> Device:
+        coordinator._circuit_breaker("infos").record_failure()
+        raise ClientError("Cloud unreachable")
+
+    with patch.object(coordinator, "_async_fetch_device", side_effect=fetch_device):
+        await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert coordinator.circuit_breakers["infos"].state == CIRCUIT_CLOSED
+    assert coordinator.stale
+
+
+async def test_single_flight_error_without_waiters(
+    hass: HomeAssistant, coordinator: GruenbeckCloudCoordinator
+) -> None:
+    """Test the error of a request is retrieved after all callers cancelled."""
+    errors: list[dict[str, Any]] = []
+    hass.loop.set_exception_handler(lambda _, context: errors.append(context))
+    started = asyncio.Event()
+
+    async def call() -> None:
+        started.set()
+        await asyncio.sleep(0.01)
+        raise ClientError("Cloud unreachable")
+
+    waiter = asyncio.create_task(coordinator._async_single_flight("test", call))
+    await started.wait()
+    waiter.cancel()
+    await wait_until(lambda: not coordinator._flights)
+    del waiter
+    gc.collect()
+
+    assert errors == []
+
+
+async def test_single_flight_done_not_shared(
+    coordinator: GruenbeckCloudCoordinator,
+) -> None:
+    """Test a request finished without suspending is not shared with later ones."""
+    call = AsyncMock(side_effect=[1, 2])
+
+    assert await coordinator._async_single_flight("test", call) == 1
+    assert await coordinator._async_single_flight("test", call) == 2
+    assert coordinator.shared_flights == {}
+
+
+async def test_throttled_request_does_not_block_user_request(
+    coordinator: GruenbeckCloudCoordinator,
+) -> None:
+    """Test user requests get rate limit tokens before waiting background ones."""
+    rate_limiter = coordinator.account.rate_limiter
+    rate_limiter._rate = 10
+    rate_limiter._tokens = 0
+    rate_limiter._updated = time.monotonic()
+    sent: list[str] = []
+
+    def request(name: str) -> Callable[[], Awaitable[None]]:
+        async def call() -> None:
+            sent.append(name)
+
+        return call
+
+    background = asyncio.create_task(
+        coordinator._async_request(
+            "infos", request("background"), priority=PRIORITY_BACKGROUND
+        )
+    )
+    await asyncio.sleep(0)
+    await coordinator._async_request("parameters", request("user"), PRIORITY_USER)
+    await background
+
+    assert sent == ["user", "background"]
+    lanes = coordinator.statistics["account"]["rate_limiter"]
+    assert lanes["user"]["requests"] == lanes["background"]["requests"] == 1
+    assert lanes["background"]["delayed_requests"] == 1
+    assert lanes["background"]["wait_time_max"] >= lanes["user"]["wait_time_max"]
+    assert lanes["background"]["queue_depth"] == 0
+
+
+async def test_parameters_refreshed_after_write_only(
+    coordinator: GruenbeckCloudCoordinator, device: Device
+) -> None:
+    """Test pushed measurements keep the cached parameters."""
+    coordinator.data = device
+    device.parameters.soft_water_hardness = 6
+    coordinator._parameters_updated = time.monotonic()
+    for hardness in (5, 7):
+        device.realtime.actual_value_soft_water_hardness = hardness
+        coordinator.async_set_updated_data(device)
+    assert not coordinator.parameters_expired
+
+    with (
+        patch.object(coordinator, "_async_authenticate", AsyncMock()),
+        patch.object(
+            coordinator.api, "update_device_infos_parameters", return_value=device
+        ),
+        patch(
+            "custom_components.gruenbeck_cloud.coordinator.PARAMETER_WRITE_WINDOW",
+            timedelta(0),
+        ),
+    ):
+        await coordinator.update_device_infos_parameters({"soft_water_hardness": 7})
+    assert coordinator.parameters_expired
+
+
+@pytest.mark.parametrize(
+    ("side_effect", "error"),
+    [(None, None), (PyGruenbeckCloudUpdateParameterError, HomeAssistantError)],
+    ids=["success", "rejected"],
+)
+async def test_parameter_writes_merged(
+    coordinator: GruenbeckCloudCoordinator,
+    device: Device,
+    side_effect: type[Exception] | None,
+    error: type[Exception] | None,
+) -> None:
+    """Test writes within the window are sent once and resolve every caller."""
+    coordinator.data = device
+    with (
+        patch.object(coordinator, "_async_authenticate", AsyncMock()),
+        patch.object(
+            coordinator.api,
+            "update_device_infos_parameters",
+            return_value=device,
+            side_effect=side_effect,
+        ) as update_parameters,
+    ):
+        results = await asyncio.gather(
+            coordinator.update_device_infos_parameters({"buzzer": True}),
+            coordinator.update_device_infos_parameters({"buzzer_from": "02:00"}),
+            return_exceptions=True,
+        )
+
+    update_parameters.assert_awaited_once_with({"buzzer": True, "buzzer_from": "02:00"})
+    for result in results:
+        if error is None:
+            assert result is None
+        else:
+            assert isinstance(result, error)
+
+
+async def test_disconnect_cancels_parameter_write(
+    coordinator: GruenbeckCloudCoordinator, device: Device
+) -> None:
+    """Test callers of a write in flight are released on disconnect."""
+    coordinator.data = device
+    sent = asyncio.Event()
+
+    async def update_parameters(data: dict[str, Any]) -> Device:
+        sent.set()
+        await asyncio.Event().wait()
+        return device
+
+    with (
+        patch.object(coordinator, "_async_authenticate", AsyncMock()),
+        patch.object(
+            coordinator.api,
+            "update_device_infos_parameters",
+            side_effect=update_parameters,
+        ),
+        patch(
+            "custom_components.gruenbeck_cloud.coordinator.PARAMETER_WRITE_WINDOW",
+            timedelta(0),
+        ),
+    ):
+        write = asyncio.create_task(
+            coordinator.update_device_infos_parameters({"buzzer": True})
+        )
+        await sent.wait()
+        await coordinator.disconnect()
+
+    with pytest.raises(asyncio.CancelledError):
+        await write
+    assert not coordinator._write_tasks
+
+
+async def test_disconnect_during_reconnect_backoff(
+    hass: HomeAssistant, coordinator: GruenbeckCloudCoordinator
+) -> None:
+    """Test the stop listener is released once when disconnecting."""
+    api = coordinator.api
+    with (
+        patch.object(api, "connect", side_effect=PyGruenbeckCloudConnectionError),
+        patch(
+            "custom_components.gruenbeck_cloud.coordinator._websocket_reconnect_delay",
+            return_value=60,
+        ),
+    ):
+        coordinator._listen_websocket()
+        await wait_until(lambda: coordinator.websocket_reconnect_attempts == 1)
+        await coordinator.disconnect()
+
+    assert coordinator.unsub is None
+    assert coordinator._listen_task is None
+
+
+async def test_websocket_keepalive(
+    hass: HomeAssistant, coordinator: GruenbeckCloudCoordinator
+) -> None:
+    """Test the data stream is kept alive on its own timer."""
+    api = coordinator.api
+    with (
+        patch.object(type(api), "connected", PropertyMock(return_value=True)),
+        patch.object(api, "enter_sd", AsyncMock()) as enter_sd,
+        patch.object(api, "refresh_sd", side_effect=ClientError) as refresh_sd,
+    ):
+        coordinator._async_websocket_keepalive(dt_util.utcnow())
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    enter_sd.assert_awaited_once()
+    # A failed keepalive is left to the watchdog
+    refresh_sd.assert_awaited_once()
+    assert coordinator.circuit_breakers["sd"].failures == 1
+
+
+async def test_measurements_cached_until_midnight_or_regeneration(
+    coordinator: GruenbeckCloudCoordinator,
+    device: Device,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test daily measurements are fetched again on a new day or regeneration."""
+    midnight = dt_util.start_of_local_day() + timedelta(days=1)
+    freezer.move_to(midnight - timedelta(hours=12))
+    coordinator.data = device
+    device.realtime.regeneration_counter = 10
+    device.salt = [DailyUsageEntry(value=150, date=midnight.date())]
+
+    with (
+        patch.object(coordinator, "_async_authenticate", AsyncMock()),
+        patch.object(
+            coordinator.api, "get_device_salt_measurements", return_value=device
+        ) as fetch,
+        patch(
+            "custom_components.gruenbeck_cloud.coordinator"
+            ".async_import_measurement_statistics"
+        ),
+    ):
+        await coordinator._async_update_measurements("salt")
+        freezer.move_to(midnight - timedelta(seconds=1))
+        await coordinator._async_update_measurements("salt")
+        assert fetch.await_count == 1
+        assert coordinator.measurement_cache_stats == {"hits": 1, "misses": 1}
+
+        # A regeneration adds the salt it consumed to the current day
+        device.realtime.regeneration_counter = 11
+        await coordinator._async_update_measurements("salt")
+        await coordinator._async_update_measurements("salt")
+        assert fetch.await_count == 2
+
+        await coordinator._async_update_measurements("salt", force_refresh=True)
+        assert fetch.await_count == 3
+
+        freezer.move_to(midnight)
+        await coordinator._async_update_measurements("salt")
+        assert fetch.await_count == 4
+
+    assert coordinator.measurement_cache_stats == {"hits": 2, "misses": 4}
+    assert coordinator.statistics["measurement_cache"]["hit_ratio"] == 0.333
@@ -0,0 +1,79 @@
+"""Tests for the local network access of the Grünbeck Cloud integration."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from aiohttp import ClientSession, web
+from pygruenbeck_cloud.exceptions import PyGruenbeckCloudResponseError
+import pytest
+from pytest_aiohttp import AiohttpServer
+
+from custom_components.gruenbeck_cloud.local import (
+    LOCAL_REALTIME_FIELDS,
+    GruenbeckLocalClient,
+)
+
+MUX_HTTP_RESPONSE = (
+    "<data><code>ok</code>"
+    "<D_A_1_1>0.5</D_A_1_1>"
+    "<D_A_1_2>1.25</D_A_1_2>"
+    "<D_A_1_3>420</D_A_1_3>"
+    "<D_A_2_1>--</D_A_2_1>"
+    "<D_A_2_2>180</D_A_2_2>"
+    "<D_Y_5>0</D_Y_5>"
+    "</data>"
+)
+
+
+async def local_client(
+    aiohttp_server: AiohttpServer, session: ClientSession, body: str
+) -> tuple[GruenbeckLocalClient, list[dict[str, Any]]]:
+    """Return a client of a fake device answering with body and its requests."""
+    requests: list[dict[str, Any]] = []
+
+    async def handle(request: web.Request) -> web.Response:
+        """Answer like the mux_http interface of the device."""
+        requests.append(dict(await request.post()))
+        return web.Response(text=body, content_type="text/xml")
+
+    app = web.Application()
+    app.router.add_post("/mux_http", handle)
+    server = await aiohttp_server(app)
+    client = GruenbeckLocalClient(
+        session, f"{server.host}:{server.port}", timedelta(seconds=5)
+    )
+    return client, requests
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_get_realtime(aiohttp_server: AiohttpServer) -> None:
+    """Test values of the device are mapped to the realtime field names."""
+    async with ClientSession() as session:
+        client, requests = await local_client(
+            aiohttp_server, session, MUX_HTTP_RESPONSE
+        )
+        assert await client.get_realtime() == {
+            "mflow1": 0.5,
+            "mrescapa1": 1.25,
+            "mcapacity": 420,
+            "mmaint": 180,
+            "mregstatus": 0,
+        }
+
+    assert requests[0]["show"] == "|".join(LOCAL_REALTIME_FIELDS) + "~"
+    assert len(requests[0]["id"]) == 4
+
+
+@pytest.mark.parametrize(
+    "body",
+    ["<data><code>ok", "<data><code>ok</code></data>"],
+    ids=["invalid", "empty"],
+)
+@pytest.mark.usefixtures("socket_enabled")
+async def test_get_realtime_invalid(aiohttp_server: AiohttpServer, body: str) -> None:
+    """Test responses without realtime values are rejected."""
+    async with ClientSession() as session:
+        client, _ = await local_client(aiohttp_server, session, body)
+        with pytest.raises(PyGruenbeckCloudResponseError):
+            await client.get_realtime()
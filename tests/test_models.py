@@ -0,0 +1,184 @@
+"""Tests for the entity change detection of the Grünbeck Cloud integration."""
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Callable
+import dataclasses
+from typing import Any
+from unittest.mock import MagicMock
+
+from pygruenbeck_cloud.models import Device
+import pytest
+
+from custom_components.gruenbeck_cloud.coordinator import GruenbeckCloudCoordinator
+from custom_components.gruenbeck_cloud.models import GruenbeckCloudEntity
+from custom_components.gruenbeck_cloud.number import NUMBERS, GruenbeckCloudNumberEntity
+from custom_components.gruenbeck_cloud.sensor import SENSORS, GruenbeckCloudSensorEntity
+from homeassistant.core import HomeAssistant
+
+WS_FRAME_TARGET = "SendMessageToDevice"
+
+
+def description(descriptions: Any, key: str) -> Any:
+    """Return the entity description of the given key."""
+    return next(description for description in descriptions if description.key == key)
+
+
+@pytest.fixture
+async def add_entity(
+    hass: HomeAssistant, coordinator: GruenbeckCloudCoordinator, device: Device
+) -> AsyncGenerator[Callable[[GruenbeckCloudEntity], Any]]:
+    """Return a function adding an entity, returning its state write mock."""
+    coordinator.data = device
+    # Notify listeners without the coalescing debouncer
+    coordinator._coalesce_window = 0
+    entities: list[GruenbeckCloudEntity] = []
+
+    async def add(entity: GruenbeckCloudEntity) -> MagicMock:
+        entity.hass = hass
+        entity.entity_id = f"test.{entity.entity_description.key}"
+        write_state = MagicMock()
+        entity.async_write_ha_state = write_state  # type: ignore[method-assign]
+        await entity.async_added_to_hass()
+        entities.append(entity)
+        return write_state
+
+    yield add
+
+    for entity in entities:
+        await entity.async_remove()
+
+
+async def test_source_fields_traced(
+    coordinator: GruenbeckCloudCoordinator,
+    add_entity: Callable[[GruenbeckCloudEntity], Any],
+) -> None:
+    """Test the fields read by the description functions are recorded."""
+    flow_rate = GruenbeckCloudSensorEntity(
+        coordinator, description(SENSORS, "current_flow_rate")
+    )
+    next_regeneration = GruenbeckCloudSensorEntity(
+        coordinator, description(SENSORS, "next_regeneration")
+    )
+    hardness = GruenbeckCloudNumberEntity(
+        coordinator, description(NUMBERS, "soft_water_hardness")
+    )
+    for entity in (flow_rate, next_regeneration, hardness):
+        await add_entity(entity)
+
+    assert flow_rate._source_fields == {"realtime.current_flow_rate"}
+    # Properties can read any field of their section
+    assert next_regeneration._source_fields == {"device"}
+    assert hardness._source_fields == {"parameters.soft_water_hardness"}
+
+
+async def test_realtime_frame_skips_parameter_entities(
+    coordinator: GruenbeckCloudCoordinator,
+    device: Device,
+    add_entity: Callable[[GruenbeckCloudEntity], Any],
+) -> None:
+    """Test a pushed realtime frame only writes entities reading its fields."""
+    flow_rate = await add_entity(
+        GruenbeckCloudSensorEntity(
+            coordinator, description(SENSORS, "current_flow_rate")
+        )
+    )
+    hardness = await add_entity(
+        GruenbeckCloudNumberEntity(
+            coordinator, description(NUMBERS, "soft_water_hardness")
+        )
+    )
+    # The first update writes every entity
+    coordinator.async_update_listeners()
+    flow_rate.reset_mock()
+    hardness.reset_mock()
+
+    device.update_from_ws_response(
+        {
+            "type": 1,
+            "target": WS_FRAME_TARGET,
+            "arguments": [{"id": device.serial_number, "mflow1": 1.5}],
+        }
+    )
+    coordinator.async_set_updated_data(device)
+
+    assert coordinator.changed_fields == {"realtime", "realtime.current_flow_rate"}
+    flow_rate.assert_called_once()
+    hardness.assert_not_called()
+
+
+async def test_property_matches_section(
+    coordinator: GruenbeckCloudCoordinator,
+    device: Device,
+    add_entity: Callable[[GruenbeckCloudEntity], Any],
+) -> None:
+    """Test entities reading a property update on any change of its section."""
+    next_regeneration = await add_entity(
+        GruenbeckCloudSensorEntity(
+            coordinator, description(SENSORS, "next_regeneration")
+        )
+    )
+    coordinator.async_update_listeners()
+    next_regeneration.reset_mock()
+
+    # Realtime data is not read by the property
+    device.realtime.current_flow_rate = 1.5
+    coordinator.async_update_listeners()
+    next_regeneration.assert_not_called()
+
+    # Any field of the device section can change the property
+    device.has_error = True
+    coordinator.async_update_listeners()
+    next_regeneration.assert_called_once()
+
+
+async def test_untraceable_entity_always_updated(
+    coordinator: GruenbeckCloudCoordinator,
+    device: Device,
+    add_entity: Callable[[GruenbeckCloudEntity], Any],
+) -> None:
+    """Test entities are written on every update if tracing raises."""
+
+    def value_fn(device: Device) -> Any:
+        # Tracers are no dataclasses
+        return dataclasses.asdict(device.parameters)["buzzer"]
+
+    entity_description = dataclasses.replace(
+        description(NUMBERS, "soft_water_hardness"), value_fn=value_fn
+    )
+    entity = GruenbeckCloudNumberEntity(coordinator, entity_description)
+    write_state = await add_entity(entity)
+    assert entity._source_fields is None
+    coordinator.async_update_listeners()
+    write_state.reset_mock()
+
+    device.realtime.current_flow_rate = 1.5
+    coordinator.async_update_listeners()
+    write_state.assert_called_once()
+
+
+async def test_pending_write_reads_value_once(
+    coordinator: GruenbeckCloudCoordinator,
+    device: Device,
+    add_entity: Callable[[GruenbeckCloudEntity], Any],
+) -> None:
+    """Test an update checks a pending write with the traced value."""
+    value_fn = MagicMock(
+        side_effect=lambda device: device.parameters.soft_water_hardness
+    )
+    entity_description = dataclasses.replace(
+        description(NUMBERS, "soft_water_hardness"), value_fn=value_fn
+    )
+    entity = GruenbeckCloudNumberEntity(coordinator, entity_description)
+    await add_entity(entity)
+    coordinator.async_update_listeners()
+    entity._pending_write = object()
+    entity._optimistic_value = 7
+    value_fn.reset_mock()
+
+    # Device reported another value while writing
+    device.parameters.soft_water_hardness = 6
+    coordinator.async_update_listeners()
+
+    value_fn.assert_called_once()
+    assert entity._pending_write is None
+    assert entity.native_value == 6
@@ -0,0 +1,43 @@
+"""Tests for the Grünbeck Cloud sensors."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+from pygruenbeck_cloud.models import Device
+
+from custom_components.gruenbeck_cloud.const import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+)
+from custom_components.gruenbeck_cloud.coordinator import GruenbeckCloudCoordinator
+from custom_components.gruenbeck_cloud.sensor import (
+    GruenbeckCloudCircuitBreakerSensorEntity,
+)
+from homeassistant.core import HomeAssistant
+
+
+async def test_circuit_breaker_sensor_turns_half_open(
+    hass: HomeAssistant, coordinator: GruenbeckCloudCoordinator, device: Device
+) -> None:
+    """Test the breaker state is written once an open circuit is half-open."""
+    coordinator.data = device
+    breaker = coordinator._circuit_breaker("infos")
+    for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+        breaker.record_failure()
+    breaker.reset_timeout = timedelta(milliseconds=100)
+
+    entity = GruenbeckCloudCircuitBreakerSensorEntity(coordinator)
+    entity.hass = hass
+    entity.entity_id = "sensor.softliq_sd18_circuit_breaker"
+    with patch.object(entity, "async_write_ha_state") as write_state:
+        await entity.async_added_to_hass()
+        assert entity.native_value == CIRCUIT_OPEN
+
+        await asyncio.sleep(0.2)
+        write_state.assert_called_once()
+        assert entity.native_value == CIRCUIT_HALF_OPEN
+
+        await entity.async_remove()
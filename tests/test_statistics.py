@@ -0,0 +1,38 @@
+"""Tests for the long-term statistics of the Grünbeck Cloud integration."""
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import patch
+
+from pygruenbeck_cloud.models import DailyUsageEntry, Device
+
+from custom_components.gruenbeck_cloud.statistics import (
+    async_import_measurement_statistics,
+)
+from custom_components.gruenbeck_cloud.storage import GruenbeckCloudStore
+from homeassistant.components.recorder.models import StatisticMeanType
+from homeassistant.core import HomeAssistant
+
+
+async def test_import_measurement_statistics(
+    hass: HomeAssistant, device: Device
+) -> None:
+    """Test daily measurements are imported as sums without a mean."""
+    store = GruenbeckCloudStore(hass, "entry")
+    store.async_merge_measurements(
+        "salt",
+        [
+            DailyUsageEntry(value=120, date=date(2024, 5, 1)),
+            DailyUsageEntry(value=80, date=date(2024, 5, 2)),
+        ],
+    )
+    with patch(
+        "custom_components.gruenbeck_cloud.statistics.async_add_external_statistics"
+    ) as add_statistics:
+        async_import_measurement_statistics(hass, device, store, "salt")
+
+    metadata, statistics = add_statistics.call_args.args[1:]
+    assert metadata["mean_type"] is StatisticMeanType.NONE
+    assert "has_mean" not in metadata
+    assert metadata["has_sum"]
+    assert [(row["state"], row["sum"]) for row in statistics] == [(120, 120), (80, 200)]
@@ -0,0 +1,83 @@
+"""Tests for the local storage of the Grünbeck Cloud integration."""
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import patch
+
+from pygruenbeck_cloud.models import DailyUsageEntry, Device
+
+from custom_components.gruenbeck_cloud.const import (
+    STORAGE_DEVICE_SAVE_DELAY,
+    STORAGE_SAVE_DELAY,
+)
+from custom_components.gruenbeck_cloud.storage import GruenbeckCloudStore
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+
+async def test_device_saved_on_change(hass: HomeAssistant, device: Device) -> None:
+    """Test device snapshots are only written if they changed."""
+    store = GruenbeckCloudStore(hass, "entry")
+    with patch.object(Store, "async_delay_save") as delay_save:
+        store.async_save_device(device)
+        store.async_save_device(device)
+        assert delay_save.call_count == 1
+        assert delay_save.call_args.args[1] == STORAGE_DEVICE_SAVE_DELAY
+
+        # The pending write is not postponed by later changes
+        device.realtime.current_flow_rate = 1.5
+        store.async_save_device(device)
+        assert delay_save.call_count == 1
+        assert store.device == device
+
+        # Other data is written sooner
+        store._async_schedule_save()
+        assert delay_save.call_count == 2
+        assert delay_save.call_args.args[1] == STORAGE_SAVE_DELAY
+
+        # Written data is scheduled again on the next change
+        store._data_to_save()
+        device.realtime.current_flow_rate = 2.5
+        store.async_save_device(device)
+        assert delay_save.call_count == 3
+
+
+async def test_merge_measurements(hass: HomeAssistant) -> None:
+    """Test merged measurements count changed days and are filtered by date."""
+    store = GruenbeckCloudStore(hass, "entry")
+    with patch.object(Store, "async_delay_save") as delay_save:
+        assert (
+            store.async_merge_measurements(
+                "water",
+                [
+                    DailyUsageEntry(value=120, date=date(2026, 10, 16)),
+                    DailyUsageEntry(value=80, date=date(2026, 10, 17)),
+                ],
+            )
+            == 2
+        )
+        assert delay_save.call_count == 1
+
+        # Days with unchanged values are not counted
+        assert (
+            store.async_merge_measurements(
+                "water",
+                [
+                    DailyUsageEntry(value=80, date=date(2026, 10, 17)),
+                    DailyUsageEntry(value=30, date=date(2026, 10, 18)),
+                ],
+            )
+            == 1
+        )
+        assert store.async_merge_measurements("water", []) == 0
+        assert delay_save.call_count == 2
+
+    assert [entry.value for entry in store.measurements("water")] == [120, 80, 30]
+    assert store.measurements("water", start=date(2026, 10, 17)) == [
+        DailyUsageEntry(value=80, date=date(2026, 10, 17)),
+        DailyUsageEntry(value=30, date=date(2026, 10, 18)),
+    ]
+    assert store.measurements(
+        "water", start=date(2026, 10, 16), end=date(2026, 10, 16)
+    ) == [DailyUsageEntry(value=120, date=date(2026, 10, 16))]
+    assert store.measurements("salt") == []